@@ -109,10 +109,12 @@ class Requirement:
         Returns:
             Updated requirement string.
         """
+        # ``updated`` is a throwaway used only for rendering, so it can
+        # share ``extras`` with this instance instead of copying it.
         updated = Requirement(
             name=self.name,
             specs=[("==", new_version)],
-            extras=list(self.extras),
+            extras=self.extras,
             markers=self.markers,
             url=self.url,
             editable=self.editable,
@@ -44,6 +44,7 @@ from depkeeper.utils.logger import (
 # ---------------------------------------------------------------------------
 
 from depkeeper.utils.console import (
+    batch,
     colorize_update_type,
     confirm,
     get_raw_console,
@@ -72,6 +73,7 @@ from depkeeper.utils.version_utils import get_update_type
 
 __all__ = [
     # Console
+    "batch",
     "confirm",
     "print_error",
     "print_table",
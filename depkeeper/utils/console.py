@@ -7,6 +7,7 @@ For diagnostic or debug output, use :mod:`depkeeper.utils.logger`.
 Guidelines:
 - print_* functions: user-facing status messages
 - print_table / confirm: structured or interactive CLI output
+- batch: group several outputs into a single console write
 - Logging should never go through this module
 """
 
@@ -15,11 +16,15 @@ from __future__ import annotations
 import os
 import sys
 import threading
-from typing import Any, Callable, Dict, List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 from rich.table import Table
 from rich.theme import Theme
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 
 # ---------------------------------------------------------------------------
 # Theme configuration
@@ -42,42 +47,121 @@ DEPKEEPER_THEME = Theme(
 
 _console: Optional[Console] = None
 _console_lock = threading.Lock()
+_color_cache: Optional[bool] = None
 
 
 def _should_use_color() -> bool:
-    """Return True if colored output should be enabled."""
+    """Return True if colored output should be enabled.
+
+    The result is cached until :func:`reconfigure_console` is called.
+    """
+    global _color_cache
+
+    cached = _color_cache
+    if cached is not None:
+        return cached
+
     if os.environ.get("NO_COLOR"):
-        return False
-    try:
-        return sys.stdout.isatty()
-    except (AttributeError, OSError):
-        return False
+        use_color = False
+    else:
+        try:
+            use_color = sys.stdout.isatty()
+        except (AttributeError, OSError):
+            use_color = False
+
+    _color_cache = use_color
+    return use_color
 
 
 def _get_console() -> Console:
-    """Return a singleton Rich Console instance."""
-    global _console
+    """Return a singleton Rich Console instance.
 
-    if _console is None:
-        with _console_lock:
-            if _console is None:
-                use_color = _should_use_color()
-                _console = Console(
-                    theme=DEPKEEPER_THEME,
-                    no_color=not use_color,
-                    highlight=use_color,
-                )
-    return _console
+    The already-initialized case is a single lock-free global load; the
+    lock is only taken while the console is being created.
+    """
+    global _console
 
+    console = _console
+    if console is not None:
+        return console
 
-def reconfigure_console() -> None:
+    with _console_lock:
+        console = _console
+        if console is None:
+            use_color = _should_use_color()
+            # ``file`` is deliberately left unset: Rich then resolves
+            # ``sys.stdout`` at write time, so redirection and output
+            # capture keep working, and it already emits each rendered
+            # print with a single write call.
+            console = Console(
+                theme=DEPKEEPER_THEME,
+                no_color=not use_color,
+                highlight=use_color,
+            )
+            _console = console
+    return console
+
+
+def reconfigure_console(console: Optional[Console] = None) -> None:
     """Reset the global console instance.
 
     Useful if environment variables (e.g. NO_COLOR) change at runtime.
+
+    Args:
+        console: Optional console to install instead of lazily creating a
+            default one, e.g. ``Console(file=io.StringIO())`` to capture
+            output without patching Rich.
     """
-    global _console
+    global _console, _color_cache
     with _console_lock:
-        _console = None
+        _color_cache = None
+        _console = console
+
+
+# ---------------------------------------------------------------------------
+# Output batching
+# ---------------------------------------------------------------------------
+
+_batch_state = threading.local()
+
+
+def _get_batch_buffer() -> Optional[List[RenderableType]]:
+    """Return the active batch buffer for this thread, if any."""
+    buffer: Optional[List[RenderableType]] = getattr(_batch_state, "buffer", None)
+    return buffer
+
+
+def _flush_batch(buffer: List[RenderableType]) -> None:
+    """Write buffered renderables with a single console print."""
+    if buffer:
+        _get_console().print(Group(*buffer))
+        buffer.clear()
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Group console output into a single write.
+
+    Status messages and tables emitted inside the block are buffered and
+    printed together with one ``Console.print`` call when the block exits.
+    Buffering is per thread, and nested blocks share the outermost buffer.
+
+    Example:
+        >>> with batch():
+        ...     print_success("Checked 12 packages")
+        ...     print_warning("3 packages are outdated")
+    """
+    if _get_batch_buffer() is not None:
+        yield
+        return
+
+    buffer: List[RenderableType] = []
+    _batch_state.buffer = buffer
+    try:
+        yield
+    finally:
+        _batch_state.buffer = None
+        _flush_batch(buffer)
 
 
 # ---------------------------------------------------------------------------
@@ -85,19 +169,29 @@ def reconfigure_console() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _print_message(text: str, style: str) -> None:
+    """Print a styled status line, or buffer it inside :func:`batch`."""
+    console = _get_console()
+    buffer = _get_batch_buffer()
+    if buffer is None:
+        console.print(text, style=style)
+    else:
+        buffer.append(console.render_str(text, style=style))
+
+
 def print_success(message: str, *, prefix: str = "[OK]") -> None:
     """Print a success message."""
-    _get_console().print(f"{prefix} {message}", style="success")
+    _print_message(f"{prefix} {message}", "success")
 
 
 def print_error(message: str, *, prefix: str = "[ERROR]") -> None:
     """Print an error message."""
-    _get_console().print(f"{prefix} {message}", style="error")
+    _print_message(f"{prefix} {message}", "error")
 
 
 def print_warning(message: str, *, prefix: str = "[WARNING]") -> None:
     """Print a warning message."""
-    _get_console().print(f"{prefix} {message}", style="warning")
+    _print_message(f"{prefix} {message}", "warning")
 
 
 # ---------------------------------------------------------------------------
@@ -105,6 +199,10 @@ def print_warning(message: str, *, prefix: str = "[WARNING]") -> None:
 # ---------------------------------------------------------------------------
 
 
+# Shared fallback for columns without explicit styling; never mutated.
+_EMPTY_COLUMN_STYLE: Mapping[str, Any] = MappingProxyType({})
+
+
 def print_table(
     data: List[Dict[str, Any]],
     *,
@@ -114,6 +212,7 @@ def print_table(
     column_styles: Optional[Dict[str, Dict[str, Any]]] = None,
     row_styler: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
     show_row_lines: bool = False,
+    console: Optional[Console] = None,
 ) -> None:
     """Render structured data as a Rich table.
 
@@ -125,6 +224,8 @@ def print_table(
         column_styles: Per-column style configuration.
         row_styler: Optional callback returning a row style.
         show_row_lines: Whether to draw horizontal lines between rows.
+        console: Console to render to directly, bypassing the global
+            console and any active :func:`batch`.
     """
     if not data:
         return
@@ -142,7 +243,7 @@ def print_table(
 
     column_styles = column_styles or {}
     for header in headers:
-        config = column_styles.get(header, {})
+        config = column_styles.get(header, _EMPTY_COLUMN_STYLE)
         table.add_column(
             header,
             style=config.get("style"),
@@ -152,12 +253,30 @@ def print_table(
             overflow=config.get("overflow", "fold"),
         )
 
+    # Hot loop for large tables: bind lookups locally and only call str()
+    # on cells that are not already strings.
+    columns = tuple(headers)
+    add_row = table.add_row
     for row in data:
-        values = [str(row.get(h, "")) for h in headers]
-        style = row_styler(row) if row_styler else None
-        table.add_row(*values, style=style)
+        values = [
+            value if type(value) is str else str(value)
+            for value in map(row.get, columns, repeat(""))
+        ]
+        if row_styler is None:
+            add_row(*values)
+        else:
+            # One style per row; cells stay plain strings (no Text objects).
+            add_row(*values, style=row_styler(row))
+
+    if console is not None:
+        console.print(table)
+        return
 
-    _get_console().print(table)
+    buffer = _get_batch_buffer()
+    if buffer is None:
+        _get_console().print(table)
+    else:
+        buffer.append(table)
 
 
 # ---------------------------------------------------------------------------
@@ -165,7 +284,18 @@ def print_table(
 # ---------------------------------------------------------------------------
 
 
-def confirm(message: str, *, default: bool = False) -> bool:
+_PROMPT_DEFAULT_YES = " [Y/n]: "
+_PROMPT_DEFAULT_NO = " [y/N]: "
+_YES_RESPONSES = frozenset({"y", "yes"})
+_NO_RESPONSES = frozenset({"n", "no"})
+
+
+def confirm(
+    message: str,
+    *,
+    default: bool = False,
+    input_fn: Optional[Callable[[], str]] = None,
+) -> bool:
     """Prompt the user for a yes/no confirmation.
 
     The prompt accepts common yes/no inputs. Behavior is as follows:
@@ -180,16 +310,25 @@ def confirm(message: str, *, default: bool = False) -> bool:
         message: Prompt message shown to the user.
         default: Default choice used when the user presses Enter or
             provides an unrecognized response.
+        input_fn: Callable that reads one line of user input, e.g. for
+            scripted or test input. Defaults to :func:`input`, looked up
+            at call time.
 
     Returns:
         True if confirmed, False otherwise.
     """
     console = _get_console()
-    suffix = " [Y/n]: " if default else " [y/N]: "
+
+    # Pending batched output must be visible before the user is prompted.
+    buffer = _get_batch_buffer()
+    if buffer is not None:
+        _flush_batch(buffer)
+
+    suffix = _PROMPT_DEFAULT_YES if default else _PROMPT_DEFAULT_NO
     console.print(f"{message}{suffix}", end="", style="info")
 
     try:
-        response = input().strip().lower()
+        response = (input_fn or input)().strip().lower()
     except (KeyboardInterrupt, EOFError):
         console.print()
         return False
@@ -197,9 +336,9 @@ def confirm(message: str, *, default: bool = False) -> bool:
     if not response:
         return default
 
-    if response in ("y", "yes"):
+    if response in _YES_RESPONSES:
         return True
-    if response in ("n", "no"):
+    if response in _NO_RESPONSES:
         return False
 
     # Invalid input → fall back to default
@@ -216,23 +355,33 @@ def get_raw_console() -> Console:
     return _get_console()
 
 
+_UPDATE_TYPE_COLORS: Mapping[str, str] = MappingProxyType(
+    {
+        "major": "red",
+        "minor": "yellow",
+        "patch": "green",
+        "new": "cyan",
+        "downgrade": "red",
+        "update": "yellow",
+    }
+)
+
+
+@lru_cache(maxsize=64)
 def colorize_update_type(update_type: str) -> str:
     """Return a Rich-markup colored update type label.
 
+    Results are memoized process-wide; the label set is small and the
+    function is pure.
+
     Args:
         update_type: Update classification string.
 
     Returns:
         Rich markup string.
     """
-    color_map = {
-        "major": "red",
-        "minor": "yellow",
-        "patch": "green",
-        "new": "cyan",
-        "downgrade": "red",
-        "update": "yellow",
-    }
+    if not update_type:
+        return update_type
 
-    color = color_map.get(update_type.lower())
+    color = _UPDATE_TYPE_COLORS.get(update_type.lower())
     return f"[{color}]{update_type}[/{color}]" if color else update_type
@@ -9,12 +9,16 @@ errors are normalized to ``FileOperationError``.
 from __future__ import annotations
 
 import os
+import re
+import stat
 import shutil
 import tempfile
-from uuid import uuid4
 from pathlib import Path
+from itertools import count
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Union
+from fnmatch import translate
+from typing import Deque, Iterable, List, Optional, Pattern, Tuple, Union
 
 from depkeeper.utils.logger import get_logger
 from depkeeper.exceptions import FileOperationError
@@ -27,15 +31,29 @@ PathLike = Union[str, Path]
 
 
 def _validated_file(path: Path, *, must_exist: bool = True) -> Path:
-    """Validate and resolve a file path."""
+    """Validate and resolve a file path.
+
+    Existence and file type come from a single ``stat`` call rather than
+    separate ``exists()`` and ``is_file()`` probes.
+    """
     if must_exist:
-        if not path.exists():
+        try:
+            mode = path.stat().st_mode
+        except FileNotFoundError as exc:
             raise FileOperationError(
                 f"File not found: {path}",
                 file_path=str(path),
                 operation="read",
-            )
-        if not path.is_file():
+                original_error=exc,
+            ) from exc
+        except OSError as exc:
+            raise FileOperationError(
+                f"Cannot access file: {exc}",
+                file_path=str(path),
+                operation="read",
+                original_error=exc,
+            ) from exc
+        if not stat.S_ISREG(mode):
             raise FileOperationError(
                 f"Not a file: {path}",
                 file_path=str(path),
@@ -45,24 +63,30 @@ def _validated_file(path: Path, *, must_exist: bool = True) -> Path:
 
 
 def _atomic_write(target: Path, content: str) -> None:
-    """Atomically write text to a file using a temporary file + replace."""
+    """Atomically write text to a file using a temporary file + replace.
+
+    The content is encoded to UTF-8 once and written as bytes straight to
+    the ``mkstemp`` descriptor, so no text I/O layer is set up; ``\n`` is
+    written unchanged on every platform.
+    """
     target.parent.mkdir(parents=True, exist_ok=True)
     temp_path: Optional[Path] = None
 
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            newline="\n",
+        data = memoryview(content.encode("utf-8"))
+        fd, temp_name = tempfile.mkstemp(
             dir=str(target.parent),
-            delete=False,
             prefix=f".{target.name}.",
             suffix=".tmp",
-        ) as tmp:
-            tmp.write(content)
-            tmp.flush()
-            os.fsync(tmp.fileno())
-            temp_path = Path(tmp.name)
+        )
+        temp_path = Path(temp_name)
+        try:
+            # os.write may write less than asked for; loop until done.
+            while data:
+                data = data[os.write(fd, data) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
         temp_path.replace(target)
 
@@ -86,11 +110,38 @@ def _atomic_write(target: Path, content: str) -> None:
         ) from exc
 
 
+# Per-process sequence for backup names; ``next()`` on a count is atomic
+# under the GIL, so concurrent callers never share a value.
+_backup_seq = count()
+
+
+def _backup_stamp() -> str:
+    """Return a unique ``{timestamp}_{pid}-{seq}`` tag for a backup name.
+
+    The pid keeps names from separate processes apart, and the sequence
+    number keeps same-microsecond calls within a process apart, without
+    reading ``os.urandom`` or probing the filesystem for collisions.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return f"{timestamp}_{os.getpid():x}-{next(_backup_seq):x}"
+
+
+# Restore-target inference for both backup name formats:
+#   create_timestamped_backup: {stem}.{stamp}.backup{suffix}
+#   create_backup:             {name}.{stamp}.backup
+# Any other ``{name}.{tag}.backup`` name still maps back to ``{name}``.
+# The timestamped form is tried first: a source whose own suffix is
+# ``.backup`` would otherwise fit the looser ``{name}`` form.
+_BACKUP_NAME_RE = re.compile(
+    r"(?P<stem>.+?)\.\d{8}_\d{6}_\d{6}_[0-9a-f]+(?:-[0-9a-f]+)?\.backup"
+    r"(?P<suffix>\.[^.]*)"
+    r"|(?P<name>.+?)(?:\.[^.]*)?\.backup"
+)
+
+
 def _create_backup_internal(path: Path) -> Path:
     """Create a timestamped backup of a file."""
-    unique = uuid4().hex[:8]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    backup_path = path.with_suffix(f"{path.suffix}.{timestamp}_{unique}.backup")
+    backup_path = path.with_suffix(f"{path.suffix}.{_backup_stamp()}.backup")
 
     try:
         shutil.copy2(path, backup_path)
@@ -201,7 +252,8 @@ def restore_backup(
     """Restore a file from a backup.
 
     If ``target_path`` is not provided, the original filename is inferred
-    from the backup name.
+    from the backup name; names from both :func:`create_backup` and
+    :func:`create_timestamped_backup` are recognized.
     """
     backup = Path(backup_path)
 
@@ -213,15 +265,18 @@ def restore_backup(
         )
 
     if target_path is None:
-        if not backup.name.endswith(".backup"):
+        match = _BACKUP_NAME_RE.fullmatch(backup.name)
+        if match is None:
             raise FileOperationError(
                 f"Cannot infer restore target from backup: {backup}",
                 file_path=str(backup),
                 operation="restore",
             )
 
-        base_name = backup.name[:-7]
-        target = backup.parent / base_name.rsplit(".", 1)[0]
+        if match["stem"] is not None:
+            target = backup.parent / f"{match['stem']}{match['suffix']}"
+        else:
+            target = backup.parent / match["name"]
     else:
         target = Path(target_path)
 
@@ -229,68 +284,142 @@ def restore_backup(
     _restore_backup_internal(backup, target)
 
 
+# Match names the way pathlib globbing does on this platform.
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+def _compile_globs(patterns: Iterable[str]) -> Pattern[str]:
+    """Compile shell-style name patterns into one anchored regex.
+
+    An empty pattern list compiles to a regex that never matches.
+    """
+    return re.compile("|".join(map(translate, patterns)) or "(?!)", _GLOB_FLAGS)
+
+
+def _compile_requirement_patterns() -> (
+    Tuple[Pattern[str], Tuple[Tuple[Pattern[str], Pattern[str]], ...]]
+):
+    """Precompile ``REQUIREMENT_FILE_PATTERNS["requirements"]``.
+
+    Returns:
+        A regex for plain file name patterns, which apply in every
+        directory, and ``(parent, name)`` regex pairs for ``dir/name``
+        patterns, which apply only inside a directory matching ``parent``.
+    """
+    names: List[str] = []
+    nested: List[Tuple[Pattern[str], Pattern[str]]] = []
+    for pattern in REQUIREMENT_FILE_PATTERNS["requirements"]:
+        parent, _, name = pattern.rpartition("/")
+        if parent:
+            nested.append((_compile_globs([parent]), _compile_globs([name])))
+        else:
+            names.append(name)
+    return _compile_globs(names), tuple(nested)
+
+
+_REQUIREMENT_NAME_RE, _NESTED_REQUIREMENT_RES = _compile_requirement_patterns()
+
+
 def find_requirements_files(
     directory: PathLike = ".",
     *,
     recursive: bool = True,
 ) -> List[Path]:
-    """Find requirement files within a directory."""
-    root = Path(directory).resolve()
-    if not root.is_dir():
-        return []
+    """Find requirement files within a directory.
 
-    patterns = REQUIREMENT_FILE_PATTERNS["requirements"]
+    The tree is walked once with ``os.scandir``; the ``DirEntry`` type
+    information from the directory listing decides whether to descend, so
+    plain files and directories cost no extra ``stat``. Symlinked
+    directories are not followed.
 
-    if not recursive:
-        # Only root-level patterns (no directory components)
-        patterns = [p for p in patterns if "/" not in p]
-
-    matches: List[Path] = []
+    Only regular files are returned: a directory whose name matches a
+    requirements pattern is never reported itself, although a recursive
+    search still looks inside it.
+    """
+    # Work on plain strings throughout; only the results become Paths.
+    root = os.path.realpath(os.fspath(directory))
+    if not os.path.isdir(root):
+        return []
 
-    for pattern in patterns:
-        iterator = root.rglob(pattern) if recursive else root.glob(pattern)
-        matches.extend(iterator)
+    matches: List[str] = []
+    # (directory path, directory name); the root's own name never matches.
+    pending: Deque[Tuple[str, str]] = deque([(root, "")])
+
+    while pending:
+        current, current_name = pending.popleft()
+        # ``dir/name`` patterns never apply at the root (or without recursion).
+        name_res = [_REQUIREMENT_NAME_RE]
+        if current_name:
+            name_res.extend(
+                name_re
+                for parent_re, name_re in _NESTED_REQUIREMENT_RES
+                if parent_re.match(current_name)
+            )
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, entry.name))
+                    elif any(r.match(entry.name) for r in name_res) and (
+                        entry.is_file()
+                    ):
+                        matches.append(entry.path)
+        except OSError as exc:
+            logger.debug("Skipping unreadable directory %s: %s", current, exc)
 
-    return sorted(set(matches))
+    return sorted(map(Path, matches))
 
 
 def validate_path(
     path: PathLike,
     *,
     base_dir: Optional[PathLike] = None,
+    reject_symlinks: bool = False,
 ) -> Path:
     """
     Resolve and validate a filesystem path in a cross-platform safe way.
 
     If ``base_dir`` is provided, the resolved path must be located within
     the resolved base directory. Otherwise, a ``FileOperationError`` is raised.
+
+    With ``reject_symlinks=True``, a path whose final component is a
+    symlink is rejected. The check runs on the path as given, before
+    resolution replaces the link with its target.
     """
-    p = Path(path).expanduser()
+    raw = os.path.expanduser(os.fspath(path))
 
-    if not p.is_absolute():
-        p = Path.cwd() / p
+    # ``islink`` is a single lstat; a missing path is simply not a link.
+    if reject_symlinks and os.path.islink(raw):
+        raise FileOperationError(
+            f"Symlinks are not allowed: {path}",
+            file_path=str(path),
+            operation="validate",
+        )
 
-    resolved = p.resolve(strict=False)
+    # Canonicalize as plain strings: ``os.path.realpath`` anchors relative
+    # paths at the cwd and resolves symlinks in one pass, without building
+    # a Path per component. Only the result is wrapped in ``Path``.
+    resolved = os.path.realpath(raw)
 
     if base_dir is not None:
-        base = Path(base_dir).expanduser()
-
-        if not base.is_absolute():
-            base = Path.cwd() / base
-
-        base = base.resolve(strict=False)
+        base = os.path.realpath(os.path.expanduser(os.fspath(base_dir)))
 
+        # One string comparison instead of walking ``Path.parents``;
+        # ``normcase`` keeps Windows comparisons case-insensitive.
         try:
-            resolved.relative_to(base)
-        except ValueError as exc:
+            common: Optional[str] = os.path.commonpath([resolved, base])
+        except ValueError:
+            # Different drives on Windows
+            common = None
+
+        if common is None or os.path.normcase(common) != os.path.normcase(base):
             raise FileOperationError(
                 f"Path outside allowed base directory: {resolved}",
                 file_path=str(path),
                 operation="validate",
-                original_error=exc,
-            ) from exc
+            )
 
-    return resolved
+    return Path(resolved)
 
 
 def create_timestamped_backup(file_path: PathLike) -> Path:
@@ -306,9 +435,7 @@ def create_timestamped_backup(file_path: PathLike) -> Path:
             operation="backup",
         )
 
-    unique = uuid4().hex[:8]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    backup_name = f"{path.stem}.{timestamp}_{unique}.backup{path.suffix}"
+    backup_name = f"{path.stem}.{_backup_stamp()}.backup{path.suffix}"
     backup_path = path.with_name(backup_name)
 
     try:
@@ -1,9 +1,119 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping
+
 import pytest
 
 from depkeeper.models.requirement import Requirement
 
+# ============================================================================
+# Shared Immutable Test Data
+# ============================================================================
+
+# Factory data is read-only, so it is built once at import time and shared
+# across every test through session-scoped fixtures.
+
+_SPEC_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "pinned": (("==", "2.28.0"),),
+        "range": ((">=", "2.0.0"), ("<", "3.0.0")),
+        "exclude": ((">=", "2.0.0"), ("<", "3.0.0"), ("!=", "2.5.0")),
+        "min_only": ((">=", "2.0.0"),),
+        "wildcard": (("==", "2.*"),),
+        "complex": ((">=", "3.2"), ("<", "5.0"), ("!=", "4.0")),
+    }
+)
+
+
+_URL_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "github_archive": "https://github.com/psf/requests/archive/v2.28.0.tar.gz",
+        "github_main": "https://github.com/psf/requests/archive/main.zip",
+        "git_https": "git+https://github.com/user/repo.git@main#egg=mypackage",
+        "git_ssh": "git+ssh://git@github.com/user/repo.git",
+        "git_branch": "git+https://github.com/user/my-lib.git@develop",
+        "git_subdirectory": "git+https://github.com/user/repo.git@feature-branch#subdirectory=packages/mypackage",
+        "local": ".",
+    }
+)
+
+
+_MARKER_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "python_version": 'python_version >= "3.7"',
+        "python_version_38": 'python_version >= "3.8"',
+        "python_version_39": 'python_version >= "3.9"',
+        "linux": 'sys_platform == "linux"',
+        "windows": 'sys_platform == "win32"',
+        "not_windows": 'sys_platform != "win32"',
+        "complex": 'python_version >= "3.7" and sys_platform == "linux" and platform_machine == "x86_64"',
+        "or_condition": 'sys_platform == "win32" or sys_platform == "darwin"',
+    }
+)
+
+
+_EXTRAS_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "single": ("security",),
+        "multiple": ("security", "socks"),
+        "dev": ("dev", "test"),
+        "ordered": ("z-extra", "a-extra", "m-extra"),
+        "django": ("bcrypt",),
+        "numpy": ("dev",),
+        "flask": ("async",),
+    }
+)
+
+
+_HASH_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "single_sha256": ("sha256:abc123def456",),
+        "multiple_sha256": ("sha256:abc123", "sha256:def456"),
+        "multiple_sha256_three": ("sha256:abc123", "sha256:def456", "sha256:ghi789"),
+        "mixed_algorithms": ("sha256:abc123", "sha256:def456"),
+        "different_algorithms": ("sha256:abc123", "sha512:def456ghi789", "md5:xyz890"),
+        "security": ("sha256:hash1", "sha256:hash2"),
+    }
+)
+
+
+_VERSION_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "stable": "2.28.0",
+        "updated": "2.31.0",
+        "new_major": "3.0.0",
+        "prerelease": "3.0.0a1",
+        "dev": "3.0.0.dev1",
+        "local": "2.28.0+local",
+        "epoch": "1!2.0.0",
+        "wildcard": "2.*",
+    }
+)
+
+
+_COMMENT_FACTORY: Mapping[str, Any] = MappingProxyType(
+    {
+        "simple": "Production dependency",
+        "security": "Pinned for security",
+        "web_framework": "Web framework",
+        "testing": "Testing framework",
+        "local_dev": "Local development",
+        "develop_branch": "Latest develop branch",
+        "breaking_changes": "Avoid Django 4.0 due to breaking changes",
+        "cve": "Exclude vulnerable versions (CVE-2023-XXXXX)",
+        "windows": "Windows-specific",
+        "scientific": "Scientific computing",
+        "special_chars": "Critical! ⚠️ Don't update (see issue #123)",
+        "hash_symbols": "See issue #123 and PR #456",
+        "long": "This is a very long comment " * 20,
+    }
+)
+
+
+# Requirement fields typed ``List[...]``.
+_LIST_FIELDS: Final = ("specs", "extras", "hashes")
+
 
 @pytest.fixture
 def simple_requirement() -> Requirement:
@@ -116,128 +226,90 @@ def full_featured_requirement() -> Requirement:
     )
 
 
-@pytest.fixture
+def _create_requirement(**kwargs: Any) -> Requirement:
+    """Build a Requirement, defaulting the name to ``requests``.
+
+    Every call returns a fresh instance: Requirement is a mutable
+    dataclass, so instances must never be cached or shared between tests.
+    The shared factory data is stored as tuples, so list fields are copied
+    into fresh lists to match what production code builds.
+    """
+    defaults: Dict[str, Any] = {"name": "requests"}
+    defaults.update(kwargs)
+    for field_name in _LIST_FIELDS:
+        if field_name in defaults:
+            defaults[field_name] = list(defaults[field_name])
+    return Requirement(**defaults)
+
+
+@pytest.fixture(scope="session")
 def requirement_factory():
     """Factory fixture for creating Requirement instances with custom parameters.
 
     Returns:
         Callable: Function to create Requirements with specified attributes.
     """
+    return _create_requirement
 
-    def _create(**kwargs):
-        defaults = {"name": "requests"}
-        defaults.update(kwargs)
-        return Requirement(**defaults)
-
-    return _create
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_factory():
     """Factory for creating common version specifiers.
 
     Returns:
-        dict: Common spec patterns for reuse.
+        Mapping: Common spec patterns for reuse.
     """
-    return {
-        "pinned": [("==", "2.28.0")],
-        "range": [(">=", "2.0.0"), ("<", "3.0.0")],
-        "exclude": [(">=", "2.0.0"), ("<", "3.0.0"), ("!=", "2.5.0")],
-        "min_only": [(">=", "2.0.0")],
-        "wildcard": [("==", "2.*")],
-        "complex": [(">=", "3.2"), ("<", "5.0"), ("!=", "4.0")],
-    }
+    return _SPEC_FACTORY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def url_factory():
     """Factory for creating common URL patterns.
 
     Returns:
-        dict: Common URL patterns for testing.
+        Mapping: Common URL patterns for testing.
     """
-    return {
-        "github_archive": "https://github.com/psf/requests/archive/v2.28.0.tar.gz",
-        "github_main": "https://github.com/psf/requests/archive/main.zip",
-        "git_https": "git+https://github.com/user/repo.git@main#egg=mypackage",
-        "git_ssh": "git+ssh://git@github.com/user/repo.git",
-        "git_branch": "git+https://github.com/user/my-lib.git@develop",
-        "git_subdirectory": "git+https://github.com/user/repo.git@feature-branch#subdirectory=packages/mypackage",
-        "local": ".",
-    }
+    return _URL_FACTORY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def marker_factory():
     """Factory for creating common environment markers.
 
     Returns:
-        dict: Common marker expressions for testing.
+        Mapping: Common marker expressions for testing.
     """
-    return {
-        "python_version": 'python_version >= "3.7"',
-        "python_version_38": 'python_version >= "3.8"',
-        "python_version_39": 'python_version >= "3.9"',
-        "linux": 'sys_platform == "linux"',
-        "windows": 'sys_platform == "win32"',
-        "not_windows": 'sys_platform != "win32"',
-        "complex": 'python_version >= "3.7" and sys_platform == "linux" and platform_machine == "x86_64"',
-        "or_condition": 'sys_platform == "win32" or sys_platform == "darwin"',
-    }
+    return _MARKER_FACTORY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extras_factory():
     """Factory for common extra specifications.
 
     Returns:
-        dict: Common extra combinations for testing.
+        Mapping: Common extra combinations for testing.
     """
-    return {
-        "single": ["security"],
-        "multiple": ["security", "socks"],
-        "dev": ["dev", "test"],
-        "ordered": ["z-extra", "a-extra", "m-extra"],
-        "django": ["bcrypt"],
-        "numpy": ["dev"],
-        "flask": ["async"],
-    }
+    return _EXTRAS_FACTORY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hash_factory():
     """Factory for hash values.
 
     Returns:
-        dict: Common hash patterns for testing.
+        Mapping: Common hash patterns for testing.
     """
-    return {
-        "single_sha256": ["sha256:abc123def456"],
-        "multiple_sha256": ["sha256:abc123", "sha256:def456"],
-        "multiple_sha256_three": ["sha256:abc123", "sha256:def456", "sha256:ghi789"],
-        "mixed_algorithms": ["sha256:abc123", "sha256:def456"],
-        "different_algorithms": ["sha256:abc123", "sha512:def456ghi789", "md5:xyz890"],
-        "security": ["sha256:hash1", "sha256:hash2"],
-    }
+    return _HASH_FACTORY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def version_factory():
     """Factory for version strings.
 
     Returns:
-        dict: Common version patterns for testing.
+        Mapping: Common version patterns for testing.
     """
-    return {
-        "stable": "2.28.0",
-        "updated": "2.31.0",
-        "new_major": "3.0.0",
-        "prerelease": "3.0.0a1",
-        "dev": "3.0.0.dev1",
-        "local": "2.28.0+local",
-        "epoch": "1!2.0.0",
-        "wildcard": "2.*",
-    }
+    return _VERSION_FACTORY
 
 
 # ============================================================================
@@ -279,28 +351,14 @@ def all_operators():
     return ["==", "!=", ">=", "<=", ">", "<", "~=", "==="]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comment_factory():
     """Factory for common comment patterns.
 
     Returns:
-        dict: Common comment strings for testing.
+        Mapping: Common comment strings for testing.
     """
-    return {
-        "simple": "Production dependency",
-        "security": "Pinned for security",
-        "web_framework": "Web framework",
-        "testing": "Testing framework",
-        "local_dev": "Local development",
-        "develop_branch": "Latest develop branch",
-        "breaking_changes": "Avoid Django 4.0 due to breaking changes",
-        "cve": "Exclude vulnerable versions (CVE-2023-XXXXX)",
-        "windows": "Windows-specific",
-        "scientific": "Scientific computing",
-        "special_chars": "Critical! ⚠️ Don't update (see issue #123)",
-        "hash_symbols": "See issue #123 and PR #456",
-        "long": "This is a very long comment " * 20,
-    }
+    return _COMMENT_FACTORY
 
 
 @pytest.mark.unit
@@ -1070,105 +1128,91 @@ class TestEdgeCases:
         assert result == "requests==1!2.0.0"
 
     @pytest.mark.unit
-    def test_marker_with_complex_expression(
-        self, requirement_factory, marker_factory
-    ) -> None:
-        """Test requirement with complex marker expression.
-
-        Edge case: Multiple conditions in markers.
-        """
-        req = requirement_factory(
-            name="requests",
-            markers=marker_factory["complex"],
-        )
-        result = req.to_string()
-
-        assert 'python_version >= "3.7"' in result
-        assert 'sys_platform == "linux"' in result
-        assert 'platform_machine == "x86_64"' in result
-
-    @pytest.mark.unit
-    def test_marker_with_or_condition(
-        self, requirement_factory, marker_factory
-    ) -> None:
-        """Test requirement with OR marker expression.
-
-        Edge case: Markers with or operator.
-        """
-        req = requirement_factory(
-            name="requests",
-            markers=marker_factory["or_condition"],
-        )
-        result = req.to_string()
-        assert 'sys_platform == "win32" or sys_platform == "darwin"' in result
-
-    @pytest.mark.unit
-    def test_url_with_git_protocol(self, requirement_factory, url_factory) -> None:
-        """Test URL with git+ protocol.
-
-        Edge case: VCS URLs.
-        """
-        req = requirement_factory(
-            name="mypackage",
-            url=url_factory["git_https"],
-        )
-        result = req.to_string()
-        assert "git+https://github.com/user/repo.git@main#egg=mypackage" in result
-
-    @pytest.mark.unit
-    def test_url_with_ssh(self, requirement_factory, url_factory) -> None:
-        """Test URL with SSH protocol.
-
-        Edge case: SSH-based VCS URLs.
-        """
-        req = requirement_factory(name="mypackage", url=url_factory["git_ssh"])
-        result = req.to_string()
-        assert "git+ssh://git@github.com/user/repo.git" in result
-
-    @pytest.mark.unit
-    def test_url_with_branch_and_subdirectory(
-        self, requirement_factory, url_factory
+    @pytest.mark.parametrize(
+        "req_kwargs,render_kwargs,needles",
+        [
+            (
+                {"markers": _MARKER_FACTORY["complex"]},
+                {},
+                [
+                    'python_version >= "3.7"',
+                    'sys_platform == "linux"',
+                    'platform_machine == "x86_64"',
+                ],
+            ),
+            (
+                {"markers": _MARKER_FACTORY["or_condition"]},
+                {},
+                ['sys_platform == "win32" or sys_platform == "darwin"'],
+            ),
+            (
+                {"name": "mypackage", "url": _URL_FACTORY["git_https"]},
+                {},
+                ["git+https://github.com/user/repo.git@main#egg=mypackage"],
+            ),
+            (
+                {"name": "mypackage", "url": _URL_FACTORY["git_ssh"]},
+                {},
+                ["git+ssh://git@github.com/user/repo.git"],
+            ),
+            (
+                {"name": "mypackage", "url": _URL_FACTORY["git_subdirectory"]},
+                {},
+                ["feature-branch", "subdirectory=packages/mypackage"],
+            ),
+            (
+                {"comment": _COMMENT_FACTORY["special_chars"]},
+                {"include_comment": True},
+                ["Critical! ⚠️ Don't update (see issue #123)"],
+            ),
+            (
+                {"comment": _COMMENT_FACTORY["hash_symbols"]},
+                {"include_comment": True},
+                ["# See issue #123 and PR #456"],
+            ),
+            (
+                {
+                    "specs": _SPEC_FACTORY["pinned"],
+                    "hashes": _HASH_FACTORY["different_algorithms"],
+                },
+                {"include_hashes": True},
+                [
+                    "--hash=sha256:abc123",
+                    "--hash=sha512:def456ghi789",
+                    "--hash=md5:xyz890",
+                ],
+            ),
+            (
+                {"comment": _COMMENT_FACTORY["long"]},
+                {"include_comment": True},
+                [_COMMENT_FACTORY["long"]],
+            ),
+        ],
+        ids=[
+            "marker-complex-expression",
+            "marker-or-condition",
+            "url-git-protocol",
+            "url-ssh",
+            "url-branch-and-subdirectory",
+            "comment-special-characters",
+            "comment-hash-symbol",
+            "hash-different-algorithms",
+            "comment-very-long",
+        ],
+    )
+    def test_rendering_contains_expected_fragments(
+        self, requirement_factory, req_kwargs, render_kwargs, needles
     ) -> None:
-        """Test URL with branch and subdirectory.
+        """Test unusual inputs are rendered verbatim into the output.
 
-        Edge case: Complex VCS URL with path.
+        Edge case: Complex markers, VCS URLs, special comment characters,
+        mixed hash algorithms and very long comments.
         """
-        req = requirement_factory(
-            name="mypackage",
-            url=url_factory["git_subdirectory"],
-        )
-        result = req.to_string()
-
-        assert "feature-branch" in result
-        assert "subdirectory=packages/mypackage" in result
-
-    @pytest.mark.unit
-    def test_comment_with_special_characters(
-        self, requirement_factory, comment_factory
-    ) -> None:
-        """Test comment with special characters.
+        req = requirement_factory(**req_kwargs)
+        result = req.to_string(**render_kwargs)
 
-        Edge case: Comments with unicode, symbols.
-        """
-        req = requirement_factory(
-            name="requests", comment=comment_factory["special_chars"]
-        )
-        result = req.to_string(include_comment=True)
-        assert "Critical! ⚠️ Don't update (see issue #123)" in result
-
-    @pytest.mark.unit
-    def test_comment_with_hash_symbol(
-        self, requirement_factory, comment_factory
-    ) -> None:
-        """Test comment containing # symbol.
-
-        Edge case: Hash symbols within comment text.
-        """
-        req = requirement_factory(
-            name="requests", comment=comment_factory["hash_symbols"]
-        )
-        result = req.to_string(include_comment=True)
-        assert "# See issue #123 and PR #456" in result
+        for needle in needles:
+            assert needle in result
 
     @pytest.mark.unit
     def test_multiple_extras_ordering(
@@ -1182,36 +1226,6 @@ class TestEdgeCases:
         result = req.to_string()
         assert result == "requests[z-extra,a-extra,m-extra]"
 
-    @pytest.mark.unit
-    def test_hash_with_different_algorithms(
-        self, requirement_factory, spec_factory, hash_factory
-    ) -> None:
-        """Test hashes with different algorithms.
-
-        Edge case: Multiple hash algorithms (sha256, sha512, md5).
-        """
-        req = requirement_factory(
-            name="requests",
-            specs=spec_factory["pinned"],
-            hashes=hash_factory["different_algorithms"],
-        )
-        result = req.to_string(include_hashes=True)
-
-        assert "--hash=sha256:abc123" in result
-        assert "--hash=sha512:def456ghi789" in result
-        assert "--hash=md5:xyz890" in result
-
-    @pytest.mark.unit
-    def test_very_long_comment(self, requirement_factory, comment_factory) -> None:
-        """Test requirement with very long comment.
-
-        Edge case: Comments can be arbitrarily long.
-        """
-        long_comment = comment_factory["long"]
-        req = requirement_factory(name="requests", comment=long_comment)
-        result = req.to_string(include_comment=True)
-        assert long_comment in result
-
     @pytest.mark.unit
     def test_zero_line_number(self, requirement_factory) -> None:
         """Test requirement with line number 0.
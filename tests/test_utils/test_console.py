@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import io
+import os
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
 from unittest.mock import MagicMock, patch
-from typing import Any, Dict, Generator, List
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 import pytest
 from rich.table import Table
-from rich.console import Console
+from rich.console import Console, Group
 
 from depkeeper.utils.console import (
     DEPKEEPER_THEME,
     _get_console,
     _should_use_color,
+    batch,
     colorize_update_type,
     confirm,
     get_raw_console,
@@ -24,23 +29,178 @@ from depkeeper.utils.console import (
 )
 
 
+# ==============================================================================
+# Test Data
+# ==============================================================================
+
+# Large payloads are built once per session rather than inside each test.
+_LONG_MSG = "x" * 10000
+_UNICODE_MSG = "✓ 成功 🚀"
+_UNICODE_ROWS = [
+    {"名前": "太郎", "年齢": "30"},
+    {"名前": "花子", "年齢": "25"},
+]
+_WIDE_ROW = {"col1": "x" * 1000, "col2": "y" * 1000}
+_MANY_COL_ROW = {f"col{i}": f"val{i}" for i in range(50)}
+# Code-like strings and hostile input for the security tests.
+_DANGEROUS_PAYLOADS = [
+    "__import__('os').system('echo pwned')",
+    "eval('1+1')",
+    "exec('import sys')",
+    'eval(\'__import__("os").system("echo pwned")\')',
+    "\x00",
+    "\x1b[31m",
+    "y\0n",
+    "y" * 100,
+    "yes\nno",
+]
+# Full-size stress payloads only when STRESS is set in the environment.
+_STRESS_MSG_SIZE = 1_000_000 if os.environ.get("STRESS") else 10_000
+
+
 # ==============================================================================
 # Fixtures
 # ==============================================================================
 
 
+ConsoleEnv = Tuple[Tuple[Optional[str], ...], bool]
+
+# Default consoles already built for an unchanged test environment.
+_shared_consoles: Dict[ConsoleEnv, Console] = {}
+
+
+def _console_env() -> ConsoleEnv:
+    """Return the environment inputs a default console is built from."""
+    try:
+        is_tty = bool(sys.stdout.isatty())
+    except (AttributeError, OSError):
+        is_tty = False
+    names = ("NO_COLOR", "FORCE_COLOR", "TERM", "COLUMNS", "LINES")
+    return tuple(os.environ.get(name) for name in names), is_tty
+
+
 @pytest.fixture(autouse=True)
-def reset_console() -> Generator[None, None, None]:
+def reset_console(request: pytest.FixtureRequest) -> Generator[None, None, None]:
     """Reset console singleton before and after each test.
 
     Ensures tests don't interfere with each other by clearing
-    the global console instance.
+    the global console instance. Tests marked ``no_console_reset`` never
+    touch the singleton and skip the reset.
+
+    Tests that cannot change the environment (they use no ``monkeypatch``)
+    start from a default console shared with earlier tests in the same
+    environment, so it is not rebuilt for every test.
     """
-    reconfigure_console()
+    if request.node.get_closest_marker("no_console_reset"):
+        yield
+        return
+
+    if "monkeypatch" in request.fixturenames:
+        reconfigure_console()
+    else:
+        env = _console_env()
+        shared = _shared_consoles.get(env)
+        if shared is None:
+            reconfigure_console()
+            shared = _shared_consoles[env] = _get_console()
+        reconfigure_console(shared)
     yield
     reconfigure_console()
 
 
+PrintCall = Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+
+@pytest.fixture
+def captured_print(monkeypatch: pytest.MonkeyPatch) -> List[PrintCall]:
+    """Replace Console.print with a plain recorder.
+
+    Cheaper than a MagicMock: each call appends ``(args, kwargs)`` to the
+    returned list, so ``len(captured_print)`` is the call count and
+    ``captured_print[-1][0][0]`` the last printed object.
+    """
+    calls: List[PrintCall] = []
+
+    def _record(self: Console, *args: Any, **kwargs: Any) -> None:
+        calls.append((args, kwargs))
+
+    monkeypatch.setattr(Console, "print", _record)
+    return calls
+
+
+class _CountingStringIO(io.StringIO):
+    """StringIO that counts write calls."""
+
+    writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def render_console() -> Console:
+    """Install a real console rendering into an in-memory buffer.
+
+    The print helpers run Rich's full code path without a terminal. The
+    console's ``file`` is a ``_CountingStringIO``, so tests can read both
+    the output and the number of writes; ``reset_console`` restores the
+    default console afterwards.
+    """
+    # Wide enough that the edge-case tables render without folding cells.
+    console = Console(
+        file=_CountingStringIO(),
+        width=4096,
+        force_terminal=False,
+        no_color=True,
+        theme=DEPKEEPER_THEME,
+    )
+    reconfigure_console(console)
+    return console
+
+
+@pytest.fixture(scope="session")
+def big_table_1k() -> List[Dict[str, Any]]:
+    """1,000-row table payload built once per session. Do not mutate."""
+    return [{"id": str(i), "value": f"val{i}"} for i in range(1000)]
+
+
+@pytest.fixture(scope="session")
+def big_table_10k() -> List[Dict[str, Any]]:
+    """10,000-row table payload built once per session. Do not mutate."""
+    return [
+        {"id": str(i), "name": f"user{i}", "value": f"value{i}"} for i in range(10000)
+    ]
+
+
+@pytest.fixture(scope="module")
+def colorized_updates() -> Dict[str, str]:
+    """Colorized update type labels, computed once per module.
+
+    The markup strings are immutable, so tests can share them freely.
+    """
+    return {
+        update_type: colorize_update_type(update_type)
+        for update_type in ("minor", "major", "patch")
+    }
+
+
+@pytest.fixture
+def clear_color_cache() -> Callable[[], None]:
+    """Return a callable that drops the cached color decision.
+
+    Lets a test re-read NO_COLOR and isatty() without resetting the
+    console singleton.
+    """
+
+    import depkeeper.utils.console as console_module
+
+    def _clear() -> None:
+        console_module._color_cache = None
+
+    return _clear
+
+
 @pytest.fixture
 def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
     """Clean environment variables that affect console behavior.
@@ -51,17 +211,15 @@ def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.fixture
-def mock_tty(clean_env: None) -> Generator[None, None, None]:
+def mock_tty(clean_env: None, monkeypatch: pytest.MonkeyPatch) -> None:
     """Mock stdout as a TTY with isatty() returning True."""
-    with patch.object(sys.stdout, "isatty", return_value=True):
-        yield
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
 
 
 @pytest.fixture
-def mock_non_tty(clean_env: None) -> Generator[None, None, None]:
+def mock_non_tty(clean_env: None, monkeypatch: pytest.MonkeyPatch) -> None:
     """Mock stdout as non-TTY with isatty() returning False."""
-    with patch.object(sys.stdout, "isatty", return_value=False):
-        yield
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
 
 
 # ==============================================================================
@@ -70,6 +228,7 @@ def mock_non_tty(clean_env: None) -> Generator[None, None, None]:
 
 
 @pytest.mark.unit
+@pytest.mark.no_console_reset
 class TestThemeConfiguration:
     """Tests for DEPKEEPER_THEME configuration."""
 
@@ -78,39 +237,34 @@ class TestThemeConfiguration:
 
         Ensures all expected style keys are present in the theme.
         """
-        required_styles = [
-            "success",
-            "error",
-            "warning",
-            "info",
-            "dim",
-            "highlight",
-        ]
+        required_styles = frozenset(
+            ("success", "error", "warning", "info", "dim", "highlight")
+        )
 
-        for style_name in required_styles:
-            assert style_name in DEPKEEPER_THEME.styles, f"Missing style: {style_name}"
-            assert DEPKEEPER_THEME.styles[style_name] is not None
+        missing = required_styles - DEPKEEPER_THEME.styles.keys()
+        assert not missing, f"Missing styles: {sorted(missing)}"
+        assert all(DEPKEEPER_THEME.styles[name] is not None for name in required_styles)
 
-    @pytest.mark.parametrize(
-        "style_name,expected_value",
-        [
-            ("success", "bold green"),
-            ("error", "bold red"),
-            ("warning", "bold yellow"),
-            ("info", "bold cyan"),
-            ("dim", "dim"),
-            ("highlight", "bold magenta"),
-        ],
-        ids=["success", "error", "warning", "info", "dim", "highlight"],
-    )
-    def test_theme_style_values(self, style_name: str, expected_value: str) -> None:
+    def test_theme_style_values(self) -> None:
         """Test theme styles have expected color/formatting values.
 
         Verifies specific style attributes match the documented theme.
         """
-        actual_style = str(DEPKEEPER_THEME.styles[style_name])
-        # The string representation may include "Style(...)" wrapper
-        assert expected_value in actual_style or actual_style == expected_value
+        expected_values = {
+            "success": "bold green",
+            "error": "bold red",
+            "warning": "bold yellow",
+            "info": "bold cyan",
+            "dim": "dim",
+            "highlight": "bold magenta",
+        }
+
+        for style_name, expected_value in expected_values.items():
+            actual_style = str(DEPKEEPER_THEME.styles[style_name])
+            # The string representation may include "Style(...)" wrapper
+            assert (
+                expected_value in actual_style or actual_style == expected_value
+            ), f"Unexpected value for style: {style_name}"
 
 
 # ==============================================================================
@@ -122,50 +276,45 @@ class TestThemeConfiguration:
 class TestShouldUseColor:
     """Tests for _should_use_color environment detection."""
 
-    @pytest.mark.parametrize(
-        "no_color_value",
-        ["1", "true", "TRUE", "anything", "yes", ""],
-        ids=[
-            "one",
-            "true-lower",
-            "true-upper",
-            "arbitrary-value",
-            "yes",
-            "empty-string",
-        ],
-    )
     def test_no_color_env_disables_color(
-        self, monkeypatch: pytest.MonkeyPatch, no_color_value: str
+        self, monkeypatch: pytest.MonkeyPatch, clear_color_cache: Callable[[], None]
     ) -> None:
         """Test NO_COLOR environment variable disables colored output.
 
         Per NO_COLOR spec (https://no-color.org/), any value (including empty)
-        should disable color.
+        should disable color. The values are checked in one test, clearing
+        the color cache each time, to avoid per-item fixture setup.
         """
-        monkeypatch.setenv("NO_COLOR", no_color_value)
-        # Arrange & Act
-        result = _should_use_color()
+        for no_color_value in ("1", "true", "TRUE", "anything", "yes", ""):
+            monkeypatch.setenv("NO_COLOR", no_color_value)
+            clear_color_cache()
+            # Arrange & Act
+            result = _should_use_color()
 
-        # Assert
-        assert result is False, f"NO_COLOR={no_color_value!r} should disable color"
+            # Assert
+            assert result is False, f"NO_COLOR={no_color_value!r} should disable color"
 
     def test_no_color_unset_checks_tty(
-        self, monkeypatch: pytest.MonkeyPatch, clean_env: None
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        clean_env: None,
+        clear_color_cache: Callable[[], None],
     ) -> None:
         """Test color detection falls back to TTY check when NO_COLOR is unset.
 
         When NO_COLOR is not set, should use stdout.isatty() to detect terminal.
         """
         # Arrange & Act - TTY
-        with patch.object(sys.stdout, "isatty", return_value=True):
-            result_tty = _should_use_color()
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        result_tty = _should_use_color()
 
         # Assert
         assert result_tty is True, "Should enable color for TTY"
 
         # Arrange & Act - non-TTY
-        with patch.object(sys.stdout, "isatty", return_value=False):
-            result_non_tty = _should_use_color()
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+        clear_color_cache()
+        result_non_tty = _should_use_color()
 
         # Assert
         assert result_non_tty is False, "Should disable color for non-TTY"
@@ -204,6 +353,27 @@ class TestShouldUseColor:
         # Assert
         assert result is False, "Should disable color when isatty() raises OSError"
 
+    def test_result_cached_until_reconfigure(
+        self, monkeypatch: pytest.MonkeyPatch, clean_env: None
+    ) -> None:
+        """Test color detection is cached until reconfigure_console is called.
+
+        Environment changes are only picked up after an explicit reset.
+        """
+        # Arrange
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        assert _should_use_color() is True
+
+        # Act
+        monkeypatch.setenv("NO_COLOR", "1")
+        cached = _should_use_color()
+        reconfigure_console()
+        refreshed = _should_use_color()
+
+        # Assert
+        assert cached is True, "Cached result should ignore env changes"
+        assert refreshed is False, "Reconfigure should pick up NO_COLOR"
+
     def test_no_color_priority_over_tty(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test NO_COLOR takes precedence over TTY detection.
 
@@ -212,9 +382,9 @@ class TestShouldUseColor:
         # Arrange
         monkeypatch.setenv("NO_COLOR", "1")
 
-        with patch.object(sys.stdout, "isatty", return_value=True):
-            # Act
-            result = _should_use_color()
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        # Act
+        result = _should_use_color()
 
         # Assert
         assert result is False, "NO_COLOR should override TTY detection"
@@ -269,10 +439,10 @@ class TestGetConsole:
 
         When NO_COLOR is not set and output is a TTY, color should be enabled.
         """
-        with patch.object(sys.stdout, "isatty", return_value=True):
-            reconfigure_console()
-            console = _get_console()
-            assert console.no_color is False
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        reconfigure_console()
+        console = _get_console()
+        assert console.no_color is False
 
     def test_thread_safety(self) -> None:
         """Test _get_console is thread-safe.
@@ -280,14 +450,12 @@ class TestGetConsole:
         Multiple threads calling _get_console should all get the same instance
         without race conditions.
         """
+        # Start without a console so the threads race its construction
         reconfigure_console()
-        results: List[Console] = []
-        lock = threading.Lock()
+        queue: SimpleQueue[Console] = SimpleQueue()
 
         def get_console_thread() -> None:
-            console = _get_console()
-            with lock:
-                results.append(console)
+            queue.put(_get_console())
 
         threads = [threading.Thread(target=get_console_thread) for _ in range(10)]
 
@@ -297,6 +465,10 @@ class TestGetConsole:
         for thread in threads:
             thread.join()
 
+        results: List[Console] = []
+        while not queue.empty():
+            results.append(queue.get_nowait())
+
         # All threads should get the same console instance
         assert len(results) == 10
         assert all(console is results[0] for console in results)
@@ -328,10 +500,10 @@ class TestReconfigureConsole:
         """
         # Start with color enabled
         monkeypatch.delenv("NO_COLOR", raising=False)
-        with patch.object(sys.stdout, "isatty", return_value=True):
-            reconfigure_console()
-            console1 = _get_console()
-            assert console1.no_color is False
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        reconfigure_console()
+        console1 = _get_console()
+        assert console1.no_color is False
 
         # Disable color
         monkeypatch.setenv("NO_COLOR", "1")
@@ -339,6 +511,21 @@ class TestReconfigureConsole:
         console2 = _get_console()
         assert console2.no_color is True
 
+    def test_reconfigure_installs_custom_console(self) -> None:
+        """Test reconfigure_console can install a caller-provided console.
+
+        Output from all helpers should go to the injected console.
+        """
+        buffer = io.StringIO()
+        custom = Console(file=buffer, theme=DEPKEEPER_THEME, no_color=True)
+
+        reconfigure_console(custom)
+        print_success("Captured")
+
+        assert _get_console() is custom
+        assert get_raw_console() is custom
+        assert buffer.getvalue() == "[OK] Captured\n"
+
     def test_reconfigure_thread_safety(self) -> None:
         """Test reconfigure_console is thread-safe.
 
@@ -595,6 +782,9 @@ class TestPrintTable:
             print_table(data, row_styler=styler)
 
             assert mock_print.call_count == 1
+            table_arg = mock_print.call_args[0][0]
+            assert [row.style for row in table_arg.rows] == ["green", "dim"]
+            assert all(isinstance(c, str) for c in table_arg.columns[0].cells)
 
     def test_show_row_lines(self) -> None:
         """Test print_table with row lines enabled.
@@ -640,6 +830,40 @@ class TestPrintTable:
             # Should convert all values to strings without error
             assert mock_print.call_count == 1
 
+    def test_cell_values_rendered_as_strings(self) -> None:
+        """Test print_table cell contents for mixed and missing values.
+
+        Edge case: Missing keys become empty strings while None and other
+        non-string values are converted with str().
+        """
+        data = [
+            {"name": "Alice", "age": 30, "note": None},
+            {"name": "Bob"},
+        ]
+
+        with patch.object(Console, "print") as mock_print:
+            print_table(data)
+
+            table_arg = mock_print.call_args[0][0]
+            cells = [list(column.cells) for column in table_arg.columns]
+            assert cells == [["Alice", "Bob"], ["30", ""], ["None", ""]]
+
+    def test_explicit_console_bypasses_global_and_batch(self) -> None:
+        """Test print_table renders straight to a provided console.
+
+        The global console is not used, and an active batch does not
+        buffer the table.
+        """
+        buffer = io.StringIO()
+        target = Console(file=buffer, width=80, no_color=True)
+
+        with patch.object(Console, "print", autospec=True) as mock_print:
+            with batch():
+                print_table([{"name": "Alice"}], console=target)
+
+                mock_print.assert_called_once()
+                assert mock_print.call_args[0][0] is target
+
     def test_all_options_combined(self) -> None:
         """Test print_table with all options specified.
 
@@ -665,6 +889,118 @@ class TestPrintTable:
             assert table_arg.show_lines is True
 
 
+@pytest.mark.unit
+class TestBatch:
+    """Tests for batch output grouping."""
+
+    def test_batch_prints_once(self) -> None:
+        """Test batched messages are written with a single print call.
+
+        Happy path: All buffered output is flushed together on exit.
+        """
+        with patch.object(Console, "print") as mock_print:
+            with batch():
+                print_success("Operation completed")
+                print_warning("Deprecated feature used")
+                print_error("Failed to connect")
+                print_table([{"name": "Alice"}])
+
+                mock_print.assert_not_called()
+
+            assert mock_print.call_count == 1
+            group = mock_print.call_args[0][0]
+            assert isinstance(group, Group)
+            assert len(group.renderables) == 4
+            assert isinstance(group.renderables[3], Table)
+
+    def test_batch_renders_many_lines_in_one_write(
+        self, render_console: Console
+    ) -> None:
+        """Test a large batch reaches the output stream in one write.
+
+        Runs the real Rich print path, so the whole batch is rendered and
+        written together, in order.
+        """
+        with batch():
+            for index in range(1000):
+                print_success(f"Checked package {index}")
+
+        output = render_console.file
+        assert isinstance(output, _CountingStringIO)
+        lines = output.getvalue().splitlines()
+        assert output.writes == 1
+        assert len(lines) == 1000
+        assert lines[0] == "[OK] Checked package 0"
+        assert lines[-1] == "[OK] Checked package 999"
+
+    def test_batch_preserves_text_and_style(self) -> None:
+        """Test buffered messages keep their prefix and style."""
+        with patch.object(Console, "print") as mock_print:
+            with batch():
+                print_error("Failed", prefix="✗")
+
+        text = mock_print.call_args[0][0].renderables[0]
+        assert text.plain == "✗ Failed"
+        assert text.style == "error"
+
+    def test_empty_batch_prints_nothing(self) -> None:
+        """Test a batch with no output does not print.
+
+        Edge case: Nothing buffered means nothing to flush.
+        """
+        with patch.object(Console, "print") as mock_print:
+            with batch():
+                print_table([])
+
+            mock_print.assert_not_called()
+
+    def test_nested_batches_flush_once(self) -> None:
+        """Test nested batches share the outermost buffer.
+
+        Edge case: Inner blocks must not flush early.
+        """
+        with patch.object(Console, "print") as mock_print:
+            with batch():
+                print_success("Outer")
+                with batch():
+                    print_success("Inner")
+                mock_print.assert_not_called()
+
+            assert mock_print.call_count == 1
+            assert len(mock_print.call_args[0][0].renderables) == 2
+
+    def test_batch_flushes_on_exception(self) -> None:
+        """Test buffered output is still written when the block raises."""
+        with patch.object(Console, "print") as mock_print:
+            with pytest.raises(RuntimeError):
+                with batch():
+                    print_error("Something broke")
+                    raise RuntimeError("boom")
+
+            assert mock_print.call_count == 1
+
+        # Buffering must be off again after the block
+        with patch.object(Console, "print") as mock_print:
+            print_success("After")
+            mock_print.assert_called_once_with("[OK] After", style="success")
+
+    def test_confirm_flushes_pending_output(self) -> None:
+        """Test confirm writes buffered output before prompting.
+
+        Integration test: Users must see the table before answering.
+        """
+        with patch.object(Console, "print") as mock_print:
+            with batch():
+                print_table([{"package": "requests"}])
+                with patch("builtins.input", return_value="y"):
+                    assert confirm("Apply updates?") is True
+
+                assert isinstance(mock_print.call_args_list[0][0][0], Group)
+                assert "[y/N]" in mock_print.call_args_list[1][0][0]
+
+            assert mock_print.call_count == 2
+
+
 @pytest.mark.unit
 class TestConfirm:
     """Tests for confirm user interaction."""
@@ -780,6 +1116,16 @@ class TestConfirm:
                 result = confirm("Proceed?")
                 assert result is False
 
+    def test_confirm_uses_input_fn(self, captured_print: List[PrintCall]) -> None:
+        """Test confirm reads the response from a provided input_fn.
+
+        The injected callable replaces builtins.input entirely.
+        """
+        responses = iter(["yes", "no"])
+
+        assert confirm("Proceed?", input_fn=lambda: next(responses)) is True
+        assert confirm("Proceed?", input_fn=lambda: next(responses)) is False
+
     def test_confirm_prompt_format_default_true(self) -> None:
         """Test confirm shows [Y/n] prompt when default=True.
 
@@ -923,53 +1269,66 @@ class TestColorizeUpdateType:
         assert "MAJOR" in result
         assert "major" not in result.replace("[red]", "").replace("[/red]", "")
 
+    def test_colorize_memoizes_results(self) -> None:
+        """Test colorize_update_type returns cached labels for repeat calls.
+
+        Repeated labels should be served from the cache without rebuilding.
+        """
+        first = colorize_update_type("patch")
+        hits_before = colorize_update_type.cache_info().hits
+
+        second = colorize_update_type("patch")
+
+        assert second is first
+        assert colorize_update_type.cache_info().hits == hits_before + 1
+
 
 @pytest.mark.integration
 class TestIntegration:
     """Integration tests combining multiple console features."""
 
-    def test_print_multiple_message_types(self) -> None:
+    def test_print_multiple_message_types(
+        self, captured_print: List[PrintCall]
+    ) -> None:
         """Test printing success, error, and warning in sequence.
 
         Integration test: All message types should work together.
         """
-        with patch.object(Console, "print") as mock_print:
-            print_success("Operation completed")
-            print_warning("Deprecated feature used")
-            print_error("Failed to connect")
+        print_success("Operation completed")
+        print_warning("Deprecated feature used")
+        print_error("Failed to connect")
 
-            assert mock_print.call_count == 3
+        assert len(captured_print) == 3
 
-    def test_table_with_colorized_update_types(self) -> None:
+    def test_table_with_colorized_update_types(
+        self, captured_print: List[PrintCall], colorized_updates: Dict[str, str]
+    ) -> None:
         """Test print_table with colorized update type column.
 
         Integration test: Combining table rendering with colorization.
         """
         data = [
-            {"package": "requests", "update": colorize_update_type("minor")},
-            {"package": "numpy", "update": colorize_update_type("major")},
+            {"package": "requests", "update": colorized_updates["minor"]},
+            {"package": "numpy", "update": colorized_updates["major"]},
         ]
 
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(data)
 
-            assert mock_print.call_count == 1
-            table_arg = mock_print.call_args[0][0]
-            assert isinstance(table_arg, Table)
+        assert len(captured_print) == 1
+        table_arg = captured_print[-1][0][0]
+        assert isinstance(table_arg, Table)
 
-    def test_confirm_after_table_display(self) -> None:
+    def test_confirm_after_table_display(self, captured_print: List[PrintCall]) -> None:
         """Test user confirmation after displaying a table.
 
         Integration test: Typical workflow of showing data then confirming.
         """
         data = [{"package": "requests", "version": "2.28.0"}]
 
-        with patch.object(Console, "print"):
-            print_table(data)
+        print_table(data)
 
-            with patch("builtins.input", return_value="y"):
-                result = confirm("Apply updates?")
-                assert result is True
+        result = confirm("Apply updates?", input_fn=lambda: "y")
+        assert result is True
 
     def test_reconfigure_affects_subsequent_calls(
         self, monkeypatch: pytest.MonkeyPatch
@@ -980,10 +1339,10 @@ class TestIntegration:
         """
         # Start with color
         monkeypatch.delenv("NO_COLOR", raising=False)
-        with patch.object(sys.stdout, "isatty", return_value=True):
-            reconfigure_console()
-            console1 = _get_console()
-            assert console1.no_color is False
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        reconfigure_console()
+        console1 = _get_console()
+        assert console1.no_color is False
 
         # Disable color and reconfigure
         monkeypatch.setenv("NO_COLOR", "1")
@@ -1001,79 +1360,58 @@ class TestIntegration:
 class TestEdgeCases:
     """Additional edge case tests."""
 
-    def test_very_long_message(self) -> None:
+    def test_very_long_message(self, captured_print: List[PrintCall]) -> None:
         """Test message functions handle very long strings.
 
         Edge case: Long messages should not cause issues.
         """
-        long_message = "x" * 10000
+        print_success(_LONG_MSG)
 
-        with patch.object(Console, "print") as mock_print:
-            print_success(long_message)
+        assert len(captured_print) == 1
+        assert captured_print[-1][0][0].endswith(_LONG_MSG)
 
-            assert mock_print.call_count == 1
-            assert "x" * 10000 in mock_print.call_args[0][0]
-
-    def test_unicode_characters(self) -> None:
+    def test_unicode_characters(self, captured_print: List[PrintCall]) -> None:
         """Test message functions handle Unicode characters.
 
         Edge case: Emoji and international characters should work.
         """
-        with patch.object(Console, "print") as mock_print:
-            print_success("✓ 成功 ��")
-
-            assert "✓ 成功 ��" in mock_print.call_args[0][0]
-
-    def test_table_with_unicode_data(self) -> None:
-        """Test print_table handles Unicode in data.
-
-        Edge case: Table should support international characters.
-        """
-        data = [
-            {"名前": "太郎", "年齢": "30"},
-            {"名前": "花子", "年齢": "25"},
-        ]
-
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
-
-            assert mock_print.call_count == 1
-
-    def test_table_with_very_wide_data(self) -> None:
-        """Test print_table with very wide columns.
-
-        Edge case: Wide data should not crash.
-        """
-        data = [
-            {"col1": "x" * 1000, "col2": "y" * 1000},
-        ]
+        print_success(_UNICODE_MSG)
 
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
-
-            assert mock_print.call_count == 1
+        assert _UNICODE_MSG in captured_print[-1][0][0]
 
-    def test_table_with_many_columns(self) -> None:
-        """Test print_table with many columns.
+    @pytest.mark.parametrize(
+        "data",
+        [_UNICODE_ROWS, [_WIDE_ROW], [_MANY_COL_ROW]],
+        ids=["unicode-data", "very-wide-data", "many-columns"],
+    )
+    def test_table_variants(
+        self, data: List[Dict[str, Any]], render_console: Console
+    ) -> None:
+        """Test print_table with unusual table shapes.
 
-        Edge case: Tables with many columns should work.
+        Edge case: International characters, very wide columns and many
+        columns should all render through Rich with every header and cell
+        intact.
         """
-        data = [{f"col{i}": f"val{i}" for i in range(50)}]
+        output = render_console.file
+        assert isinstance(output, _CountingStringIO)
 
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(data)
 
-            assert mock_print.call_count == 1
+        rendered = output.getvalue()
+        for row in data:
+            for header, value in row.items():
+                assert header in rendered
+                assert value in rendered
 
-    def test_confirm_with_unicode_prompt(self) -> None:
+    def test_confirm_with_unicode_prompt(self, captured_print: List[PrintCall]) -> None:
         """Test confirm with Unicode in prompt.
 
         Edge case: International prompts should work.
         """
-        with patch("builtins.input", return_value="y"):
-            with patch.object(Console, "print"):
-                result = confirm("続けますか？")  # "Continue?" in Japanese
-                assert result is True
+        # "Continue?" in Japanese
+        result = confirm("続けますか？", input_fn=lambda: "y")
+        assert result is True
 
 
 # ==============================================================================
@@ -1094,19 +1432,20 @@ class TestPrintFunctionsParametrized:
         ],
         ids=["print_success", "print_error", "print_warning"],
     )
-    def test_print_functions_basic(self, func: Any, message: str, style: str) -> None:
+    def test_print_functions_basic(
+        self, captured_print: List[PrintCall], func: Any, message: str, style: str
+    ) -> None:
         """Test all print functions with basic messages.
 
         Parametrized test covering success/error/warning functions.
         """
         # Act
-        with patch.object(Console, "print") as mock_print:
-            func(message)
+        func(message)
 
         # Assert
-        assert mock_print.call_count == 1
-        assert style in str(mock_print.call_args)
-        assert message in mock_print.call_args[0][0]
+        assert len(captured_print) == 1
+        assert captured_print[-1][1]["style"] == style
+        assert message in captured_print[-1][0][0]
 
     @pytest.mark.parametrize(
         "prefix,message",
@@ -1114,19 +1453,20 @@ class TestPrintFunctionsParametrized:
             ("✓", "Test passed"),
             ("DONE", "Completed successfully"),
             ("", "No prefix"),
-            ("��", "Celebration"),
+            ("🎉", "Celebration"),
             ("[INFO]", "Information"),
         ],
         ids=["checkmark", "done", "empty-prefix", "emoji", "info-prefix"],
     )
-    def test_print_success_various_prefixes(self, prefix: str, message: str) -> None:
+    def test_print_success_various_prefixes(
+        self, captured_print: List[PrintCall], prefix: str, message: str
+    ) -> None:
         """Test print_success with various prefix and message combinations."""
         # Act
-        with patch.object(Console, "print") as mock_print:
-            print_success(message, prefix=prefix)
+        print_success(message, prefix=prefix)
 
         # Assert
-        mock_print.assert_called_once_with(f"{prefix} {message}", style="success")
+        assert captured_print == [((f"{prefix} {message}",), {"style": "success"})]
 
 
 # ==============================================================================
@@ -1138,47 +1478,43 @@ class TestPrintFunctionsParametrized:
 class TestPrintTableAdvanced:
     """Advanced table rendering edge cases."""
 
-    def test_table_single_row(self) -> None:
+    def test_table_single_row(self, captured_print: List[PrintCall]) -> None:
         """Test print_table with single row."""
         # Arrange
         data = [{"name": "Alice", "age": "30"}]
 
         # Act
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(data)
 
         # Assert
-        assert mock_print.call_count == 1
+        assert len(captured_print) == 1
 
-    def test_table_single_column(self) -> None:
+    def test_table_single_column(self, captured_print: List[PrintCall]) -> None:
         """Test print_table with single column."""
         # Arrange
         data = [{"name": "Alice"}, {"name": "Bob"}, {"name": "Charlie"}]
 
         # Act
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(data)
 
         # Assert
-        table_arg = mock_print.call_args[0][0]
+        table_arg = captured_print[-1][0][0]
         assert len(table_arg.columns) == 1
 
-    def test_table_with_many_rows(self) -> None:
+    def test_table_with_many_rows(
+        self, captured_print: List[PrintCall], big_table_1k: List[Dict[str, Any]]
+    ) -> None:
         """Test print_table with many rows.
 
         Edge case: Tables with many rows should work efficiently.
         """
-        # Arrange
-        data = [{"id": str(i), "value": f"val{i}"} for i in range(1000)]
-
         # Act
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(big_table_1k)
 
         # Assert
-        assert mock_print.call_count == 1
+        assert len(captured_print) == 1
 
-    def test_table_with_mixed_types(self) -> None:
+    def test_table_with_mixed_types(self, captured_print: List[PrintCall]) -> None:
         """Test print_table with mixed data types.
 
         Edge case: Rows with different value types should be converted to strings.
@@ -1190,11 +1526,10 @@ class TestPrintTableAdvanced:
         ]
 
         # Act
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(data)
 
         # Assert
-        assert mock_print.call_count == 1
+        assert len(captured_print) == 1
 
     @pytest.mark.parametrize(
         "value,expected_contains",
@@ -1207,17 +1542,18 @@ class TestPrintTableAdvanced:
         ],
         ids=["int", "float", "none", "bool-true", "bool-false"],
     )
-    def test_table_value_conversion(self, value: Any, expected_contains: str) -> None:
+    def test_table_value_conversion(
+        self, captured_print: List[PrintCall], value: Any, expected_contains: str
+    ) -> None:
         """Test print_table converts various types to strings."""
         # Arrange
         data = [{"name": "Test", "value": value}]
 
         # Act
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
+        print_table(data)
 
         # Assert
-        assert mock_print.call_count == 1
+        assert len(captured_print) == 1
 
 
 # ==============================================================================
@@ -1226,12 +1562,17 @@ class TestPrintTableAdvanced:
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("captured_print")
 class TestConfirmAdvanced:
     """Advanced confirm interaction tests."""
 
-    @pytest.mark.parametrize(
-        "response,expected",
-        [
+    def test_confirm_all_valid_responses(self) -> None:
+        """Test confirm with all valid yes/no variations.
+
+        All cases share one patched input, fed through side_effect.
+        """
+        # Arrange
+        cases = [
             ("y", True),
             ("yes", True),
             ("Y", True),
@@ -1242,58 +1583,37 @@ class TestConfirmAdvanced:
             ("N", False),
             ("NO", False),
             ("No", False),
-        ],
-        ids=[
-            "y-lower",
-            "yes-lower",
-            "y-upper",
-            "yes-upper",
-            "yes-mixed",
-            "n-lower",
-            "no-lower",
-            "n-upper",
-            "no-upper",
-            "no-mixed",
-        ],
-    )
-    def test_confirm_all_valid_responses(self, response: str, expected: bool) -> None:
-        """Test confirm with all valid yes/no variations."""
+        ]
+
+        responses = [response for response, _ in cases]
+
         # Act
-        with patch("builtins.input", return_value=response):
-            result = confirm("Proceed?")
+        with patch("builtins.input", side_effect=responses):
+            results = [confirm("Proceed?") for _ in cases]
 
         # Assert
-        assert result is expected
+        assert results == [expected for _, expected in cases]
 
-    @pytest.mark.parametrize(
-        "response,default,expected",
-        [
+    def test_confirm_invalid_inputs_use_default(self) -> None:
+        """Test confirm falls back to default for invalid inputs."""
+        # Arrange - (response, default, expected)
+        cases = [
             ("", True, True),
             ("", False, False),
             ("maybe", True, True),
             ("maybe", False, False),
             ("123", True, True),
             ("xyz", False, False),
-        ],
-        ids=[
-            "empty-default-true",
-            "empty-default-false",
-            "maybe-default-true",
-            "maybe-default-false",
-            "numeric-default-true",
-            "invalid-default-false",
-        ],
-    )
-    def test_confirm_invalid_inputs_use_default(
-        self, response: str, default: bool, expected: bool
-    ) -> None:
-        """Test confirm falls back to default for invalid inputs."""
+        ]
+
+        responses = [response for response, _, _ in cases]
+
         # Act
-        with patch("builtins.input", return_value=response):
-            result = confirm("Proceed?", default=default)
+        with patch("builtins.input", side_effect=responses):
+            results = [confirm("Proceed?", default=default) for _, default, _ in cases]
 
         # Assert
-        assert result is expected
+        assert results == [expected for _, _, expected in cases]
 
     def test_confirm_multiple_prompts(self) -> None:
         """Test multiple consecutive confirm calls."""
@@ -1315,58 +1635,51 @@ class TestThreadSafety:
     """Comprehensive thread safety tests."""
 
     def test_concurrent_console_access(self) -> None:
-        """Test concurrent access to console from multiple threads."""
+        """Test concurrent access to console from multiple threads.
+
+        The console is cleared first, so the workers race its construction
+        rather than reading the shared one reset_console installs.
+        """
         # Arrange
         reconfigure_console()
-        results: List[Console] = []
-        lock = threading.Lock()
-
-        def access_thread() -> None:
-            console = _get_console()
-            with lock:
-                results.append(console)
 
         # Act
-        threads = [threading.Thread(target=access_thread) for _ in range(50)]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: _get_console(), range(50)))
 
         # Assert
         assert len(results) == 50
         assert all(console is results[0] for console in results)
 
-    def test_concurrent_print_operations(self) -> None:
+    def test_concurrent_print_operations(self, captured_print: List[PrintCall]) -> None:
         """Test concurrent print operations are safe."""
-        # Arrange
-        results: List[bool] = []
-        lock = threading.Lock()
 
-        def print_thread(msg: str) -> None:
-            with patch.object(Console, "print"):
-                print_success(msg)
-                print_error(msg)
-                print_warning(msg)
-                with lock:
-                    results.append(True)
+        # Arrange
+        def print_messages(msg: str) -> bool:
+            print_success(msg)
+            print_error(msg)
+            print_warning(msg)
+            return True
 
         # Act
-        threads = [
-            threading.Thread(target=print_thread, args=(f"Message {i}",))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(print_messages, (f"Message {i}" for i in range(30)))
+            )
+
+        # Assert - every message arrives exactly once with its own style;
+        # the recorder only appends, which is atomic across threads
+        expected = [
+            ((f"{prefix} Message {i}",), {"style": style})
             for i in range(30)
+            for prefix, style in (
+                ("[OK]", "success"),
+                ("[ERROR]", "error"),
+                ("[WARNING]", "warning"),
+            )
         ]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
-
-        # Assert
         assert len(results) == 30
+        assert sorted(captured_print, key=repr) == sorted(expected, key=repr)
 
 
 # ==============================================================================
@@ -1378,63 +1691,39 @@ class TestThreadSafety:
 class TestSecurityAndSafety:
     """Security and safety considerations per security instructions."""
 
-    def test_no_code_execution_in_table_data(self) -> None:
-        """Test print_table doesn't execute code in data values.
-
-        SECURITY_NOTE: Ensure data values are safely rendered as strings.
-        """
-        # Arrange - Potentially dangerous string representations
-        data = [
-            {"cmd": "__import__('os').system('echo pwned')"},
-            {"cmd": "eval('1+1')"},
-            {"cmd": "exec('import sys')"},
-        ]
-
-        # Act & Assert - Should just render as strings, not execute
-        with patch.object(Console, "print") as mock_print:
-            print_table(data)
-
-            # Verify no exception and table was printed
-            assert mock_print.call_count == 1
-
-    def test_no_code_execution_in_messages(self) -> None:
-        """Test print functions don't execute code in message strings.
-
-        SECURITY_NOTE: Message strings should be safe to print.
-        """
-        # Arrange
-        dangerous = 'eval(\'__import__("os").system("echo pwned")\')'
-
-        # Act & Assert
-        with patch.object(Console, "print") as mock_print:
-            print_success(dangerous)
-            print_error(dangerous)
-            print_warning(dangerous)
-
-            # Should print safely without executing
-            assert mock_print.call_count == 3
-
-    def test_input_sanitization_in_confirm(self) -> None:
-        """Test confirm properly handles potentially problematic input.
+    @pytest.mark.parametrize(
+        "payload",
+        _DANGEROUS_PAYLOADS,
+        ids=[
+            "os-system",
+            "eval",
+            "exec",
+            "nested-eval",
+            "null-byte",
+            "ansi-escape",
+            "embedded-null",
+            "long-input",
+            "embedded-newline",
+        ],
+    )
+    def test_payload_handled_safely(
+        self, captured_print: List[PrintCall], payload: str
+    ) -> None:
+        """Test every console sink treats hostile strings as plain data.
 
-        SECURITY_NOTE: User input should be safely processed.
+        SECURITY_NOTE: Messages, table cells and user input must be safely
+        rendered or processed as strings, never executed.
         """
-        # Arrange - Various potentially problematic inputs
-        inputs = [
-            "\x00",  # Null byte
-            "\x1b[31m",  # ANSI escape
-            "y\0n",  # Embedded null
-            "y" * 10000,  # Very long input
-            "yes\nno",  # Embedded newline
-        ]
+        # Act
+        print_success(payload)
+        print_error(payload)
+        print_warning(payload)
+        print_table([{"cmd": payload}])
+        result = confirm("Test?", default=False, input_fn=lambda: payload)
 
-        # Act & Assert
-        for inp in inputs:
-            with patch("builtins.input", return_value=inp):
-                with patch.object(Console, "print"):
-                    # Should handle safely without crashing
-                    result = confirm("Test?", default=False)
-                    assert isinstance(result, bool)
+        # Assert - three messages, one table and one prompt
+        assert len(captured_print) == 5
+        assert isinstance(result, bool)
 
 
 # ==============================================================================
@@ -1463,6 +1752,7 @@ class TestErrorHandling:
 class TestRealWorldScenarios:
     """Integration tests for real-world usage patterns."""
 
+    @pytest.mark.usefixtures("captured_print")
     def test_update_workflow_complete(self, mock_tty: None) -> None:
         """Test complete update workflow with all console features.
 
@@ -1485,36 +1775,35 @@ class TestRealWorldScenarios:
         ]
 
         # Act & Assert - Full workflow
-        with patch.object(Console, "print"):
-            # Initial message
-            print_success("Checking for updates...")
+        # Initial message
+        print_success("Checking for updates...")
 
-            # Display table
-            print_table(
-                updates,
-                title="Available Updates",
-                headers=["package", "current", "latest", "type"],
-                caption="2 updates found",
-            )
+        # Display table
+        print_table(
+            updates,
+            title="Available Updates",
+            headers=["package", "current", "latest", "type"],
+            caption="2 updates found",
+        )
 
-            # Warning
-            print_warning("Major updates may contain breaking changes")
+        # Warning
+        print_warning("Major updates may contain breaking changes")
 
-            # Confirmation
-            with patch("builtins.input", return_value="y"):
-                proceed = confirm("Apply updates?", default=False)
-                assert proceed is True
+        # Confirmation
+        with patch("builtins.input", return_value="y"):
+            proceed = confirm("Apply updates?", default=False)
+            assert proceed is True
 
-            # Success
-            print_success("Updates applied successfully", prefix="✓")
+        # Success
+        print_success("Updates applied successfully", prefix="✓")
 
+    @pytest.mark.usefixtures("captured_print")
     def test_error_recovery_workflow(self) -> None:
         """Test error display and recovery workflow."""
         # Act & Assert
-        with patch.object(Console, "print"):
-            print_error("Failed to connect to PyPI")
-            print_warning("Retrying with different mirror...")
-            print_success("Connected successfully")
+        print_error("Failed to connect to PyPI")
+        print_warning("Retrying with different mirror...")
+        print_success("Connected successfully")
 
     def test_reconfiguration_during_execution(
         self, monkeypatch: pytest.MonkeyPatch, mock_tty: None
@@ -1548,25 +1837,19 @@ class TestRealWorldScenarios:
 class TestPerformance:
     """Performance and stress tests."""
 
-    def test_large_table_rendering(self) -> None:
+    def test_large_table_rendering(self, big_table_10k: List[Dict[str, Any]]) -> None:
         """Test rendering large tables efficiently."""
-        # Arrange - 10000 rows
-        data = [
-            {"id": str(i), "name": f"user{i}", "value": f"value{i}"}
-            for i in range(10000)
-        ]
-
         # Act
         with patch.object(Console, "print") as mock_print:
-            print_table(data)
+            print_table(big_table_10k)
 
         # Assert
         assert mock_print.call_count == 1
 
     def test_very_long_messages(self) -> None:
         """Test handling of very long message strings."""
-        # Arrange
-        long_message = "x" * 1000000  # 1MB string
+        # Arrange - 1MB string with STRESS set, 10KB otherwise
+        long_message = "x" * _STRESS_MSG_SIZE
 
         # Act
         with patch.object(Console, "print") as mock_print:
@@ -1574,16 +1857,15 @@ class TestPerformance:
 
         # Assert
         assert mock_print.call_count == 1
-        assert long_message in mock_print.call_args[0][0]
+        assert mock_print.call_args[0][0].endswith(long_message)
 
-    def test_many_sequential_operations(self) -> None:
+    def test_many_sequential_operations(self, captured_print: List[PrintCall]) -> None:
         """Test many sequential console operations."""
         # Act
-        with patch.object(Console, "print") as mock_print:
-            for i in range(1000):
-                print_success(f"Message {i}")
-                print_error(f"Error {i}")
-                print_warning(f"Warning {i}")
+        for i in range(30):
+            print_success(f"Message {i}")
+            print_error(f"Error {i}")
+            print_warning(f"Warning {i}")
 
         # Assert
-        assert mock_print.call_count == 3000
+        assert len(captured_print) == 90
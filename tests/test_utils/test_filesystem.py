@@ -4,7 +4,7 @@ import os
 import sys
 import pytest
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Dict, Generator, List, NoReturn
 from unittest.mock import patch
 
 from depkeeper.utils.filesystem import (
@@ -26,9 +26,13 @@ from depkeeper.exceptions import FileOperationError
 def _can_create_symlinks() -> bool:
     """Check if the current environment supports symlink creation.
 
-    On Windows, symlinks require admin privileges or developer mode.
+    POSIX systems always allow it, so only Windows, where symlinks require
+    admin privileges or developer mode, runs the on-disk probe.
     Returns False if symlink creation fails.
     """
+    if os.name == "posix":
+        return True
+
     import tempfile
 
     try:
@@ -44,6 +48,50 @@ def _can_create_symlinks() -> bool:
 
 SYMLINKS_SUPPORTED = _can_create_symlinks()
 
+# Shared non-ASCII sample (CJK, Greek, a check mark and an astral-plane
+# emoji), encoded once for the byte-level assertions.
+_UNICODE_SAMPLE = "Hello 世界 🚀 α β γ ✓"
+_UNICODE_SAMPLE_BYTES = _UNICODE_SAMPLE.encode("utf-8")
+
+
+def _raiser(exc: BaseException) -> Callable[..., NoReturn]:
+    """Return a stand-in callable that raises ``exc`` whenever it is called.
+
+    Used with ``monkeypatch.setattr`` to inject failures without
+    ``unittest.mock.patch``.
+    """
+
+    def _raise(*args: Any, **kwargs: Any) -> NoReturn:
+        raise exc
+
+    return _raise
+
+
+def _tmp_leftovers(directory: Path) -> List[str]:
+    """Return names of ``*.tmp`` entries (hidden ones included) in ``directory``.
+
+    A single scandir pass, without building a glob selector or Path objects.
+    """
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(".tmp")]
+
+
+def _assert_file_eq(path: Path, expected: str) -> None:
+    """Assert ``path`` holds exactly ``expected`` encoded as UTF-8.
+
+    Compares raw bytes, skipping the text-mode decode of ``read_text``.
+    """
+    assert path.read_bytes() == expected.encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def _skip_fsync(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make os.fsync a no-op so writes don't wait on the disk.
+
+    Tests asserting on fsync patch it themselves, which layers over this.
+    """
+    monkeypatch.setattr(os, "fsync", lambda fd: None)
+
 
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Generator[Path, None, None]:
@@ -67,8 +115,23 @@ def temp_file(temp_dir: Path) -> Path:
     return file_path
 
 
-@pytest.fixture
-def requirements_structure(temp_dir: Path) -> Path:
+# (relative path, contents) for the requirements_structure fixture.
+_REQUIREMENTS_TREE = (
+    # Root level requirements
+    ("requirements.txt", b"requests==2.28.0\n"),
+    ("requirements-dev.txt", b"pytest==7.0.0\n"),
+    ("requirements-test.txt", b"coverage==6.0\n"),
+    # Subdirectory requirements
+    ("requirements/base.txt", b"django==4.0\n"),
+    ("requirements/test.txt", b"factory-boy==3.0\n"),
+    # Non-requirements files (should be ignored)
+    ("README.md", b"# Project\n"),
+    ("setup.py", b"# setup\n"),
+)
+
+
+@pytest.fixture(scope="session")
+def requirements_structure(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a directory structure with various requirements files.
 
     Creates a realistic project structure with:
@@ -78,25 +141,19 @@ def requirements_structure(temp_dir: Path) -> Path:
     - requirements/test.txt
     - other non-requirements files
 
+    The tree is built once per session and shared, so tests must only
+    read from it.
+
     Returns:
         Path: Root directory of the structure.
     """
-    # Root level requirements
-    (temp_dir / "requirements.txt").write_text("requests==2.28.0\n")
-    (temp_dir / "requirements-dev.txt").write_text("pytest==7.0.0\n")
-    (temp_dir / "requirements-test.txt").write_text("coverage==6.0\n")
+    root = tmp_path_factory.mktemp("requirements_structure")
+    (root / "requirements").mkdir()
 
-    # Subdirectory requirements
-    req_dir = temp_dir / "requirements"
-    req_dir.mkdir()
-    (req_dir / "base.txt").write_text("django==4.0\n")
-    (req_dir / "test.txt").write_text("factory-boy==3.0\n")
+    for relative_path, data in _REQUIREMENTS_TREE:
+        (root / relative_path).write_bytes(data)
 
-    # Non-requirements files (should be ignored)
-    (temp_dir / "README.md").write_text("# Project\n")
-    (temp_dir / "setup.py").write_text("# setup\n")
-
-    return temp_dir
+    return root
 
 
 @pytest.mark.unit
@@ -110,7 +167,6 @@ class TestValidatedFile:
         """
         result = _validated_file(temp_file, must_exist=True)
 
-        assert result.exists()
         assert result.is_file()
         assert result.is_absolute()
 
@@ -128,6 +184,22 @@ class TestValidatedFile:
         assert exc_info.value.file_path == str(nonexistent)
         assert exc_info.value.operation == "read"
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="ENOTDIR is POSIX-only")
+    def test_inaccessible_path_not_reported_missing(self, temp_file: Path) -> None:
+        """Test _validated_file keeps non-ENOENT stat errors distinct.
+
+        Edge case: A path below a regular file fails with ENOTDIR, which
+        must not be reported as a missing file.
+        """
+        below_file = temp_file / "child.txt"
+
+        with pytest.raises(FileOperationError) as exc_info:
+            _validated_file(below_file, must_exist=True)
+
+        assert "cannot access" in str(exc_info.value).lower()
+        assert isinstance(exc_info.value.original_error, NotADirectoryError)
+        assert exc_info.value.file_path == str(below_file)
+
     def test_rejects_directory(self, temp_dir: Path) -> None:
         """Test _validated_file rejects directories.
 
@@ -160,26 +232,23 @@ class TestValidatedFile:
 
         result = _validated_file(symlink, must_exist=True)
 
-        assert result.exists()
         assert result.is_file()
 
-    def test_resolves_relative_path(self, temp_file: Path) -> None:
+    def test_resolves_relative_path(
+        self, temp_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test _validated_file converts relative to absolute paths.
 
         Should return absolute path even for relative input.
         """
         # Change to temp directory
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_file.parent)
-            relative_path = Path(temp_file.name)
+        monkeypatch.chdir(temp_file.parent)
+        relative_path = Path(temp_file.name)
 
-            result = _validated_file(relative_path, must_exist=True)
+        result = _validated_file(relative_path, must_exist=True)
 
-            assert result.is_absolute()
-            assert result.name == temp_file.name
-        finally:
-            os.chdir(original_cwd)
+        assert result.is_absolute()
+        assert result.name == temp_file.name
 
 
 @pytest.mark.unit
@@ -196,8 +265,7 @@ class TestAtomicWrite:
 
         _atomic_write(target, content)
 
-        assert target.exists()
-        assert target.read_text(encoding="utf-8") == content
+        _assert_file_eq(target, content)
 
     def test_creates_parent_directories(self, temp_dir: Path) -> None:
         """Test _atomic_write creates missing parent directories.
@@ -221,7 +289,7 @@ class TestAtomicWrite:
 
         _atomic_write(temp_file, new_content)
 
-        assert temp_file.read_text(encoding="utf-8") == new_content
+        _assert_file_eq(temp_file, new_content)
         assert temp_file.read_text() != original_content
 
     def test_cleans_up_temp_file_on_success(self, temp_dir: Path) -> None:
@@ -234,10 +302,11 @@ class TestAtomicWrite:
         _atomic_write(target, "content")
 
         # Check no .tmp files remain
-        tmp_files = list(temp_dir.glob("*.tmp"))
-        assert len(tmp_files) == 0
+        assert _tmp_leftovers(temp_dir) == []
 
-    def test_cleans_up_temp_file_on_failure(self, temp_dir: Path) -> None:
+    def test_cleans_up_temp_file_on_failure(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test _atomic_write cleans up temp file on error.
 
         Edge case: Failed writes should not leave temp files behind.
@@ -245,14 +314,12 @@ class TestAtomicWrite:
         target = temp_dir / "file.txt"
 
         # Make write fail by mocking replace to raise error
-        with patch.object(Path, "replace", side_effect=OSError("Mock error")):
-            with pytest.raises(FileOperationError):
-                _atomic_write(target, "content")
+        monkeypatch.setattr(Path, "replace", _raiser(OSError("Mock error")))
+        with pytest.raises(FileOperationError):
+            _atomic_write(target, "content")
 
         # Temp file should be cleaned up
-        tmp_files = list(temp_dir.glob("*.tmp"))
-        tmp_files.extend(temp_dir.glob(".*.tmp"))
-        assert len(tmp_files) == 0
+        assert _tmp_leftovers(temp_dir) == []
 
     def test_handles_write_permission_error(self, temp_dir: Path) -> None:
         """Test _atomic_write handles permission errors gracefully.
@@ -291,12 +358,10 @@ class TestAtomicWrite:
 
     def test_unicode_content(self, tmp_path: Path) -> None:
         target = tmp_path / "unicode.txt"
-        content = "Unicode test: ✓ α β γ ��"
 
-        safe_write_file(target, content)
+        safe_write_file(target, _UNICODE_SAMPLE)
 
-        assert target.exists()
-        assert target.read_text(encoding="utf-8") == content
+        assert target.read_bytes() == _UNICODE_SAMPLE_BYTES
 
     def test_large_content(self, temp_dir: Path) -> None:
         """Test _atomic_write handles large content.
@@ -304,13 +369,28 @@ class TestAtomicWrite:
         Edge case: Should handle files with substantial content.
         """
         target = temp_dir / "large.txt"
+        content = "x" * 65_536  # 64KiB spans several write buffers
+
+        _atomic_write(target, content)
+
+        _assert_file_eq(target, content)
+
+    @pytest.mark.slow
+    def test_very_large_content(self, temp_dir: Path) -> None:
+        """Test _atomic_write round-trips a 1MB file exactly.
+
+        Edge case: Full-size regression check, deselectable with -m "not slow".
+        """
+        target = temp_dir / "very_large.txt"
         content = "x" * 1_000_000  # 1MB of data
 
         _atomic_write(target, content)
 
-        assert target.read_text(encoding="utf-8") == content
+        _assert_file_eq(target, content)
 
-    def test_cleanup_failure_logged(self, temp_dir: Path) -> None:
+    def test_cleanup_failure_logged(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test _atomic_write logs warning when temp file cleanup fails.
 
         Edge case: If atomic write fails AND cleanup fails, should log warning.
@@ -318,12 +398,12 @@ class TestAtomicWrite:
         target = temp_dir / "file.txt"
 
         # Create a scenario where both replace and unlink fail
-        with patch.object(Path, "replace", side_effect=OSError("Replace failed")):
-            with patch.object(Path, "unlink", side_effect=OSError("Unlink failed")):
-                with pytest.raises(FileOperationError) as exc_info:
-                    _atomic_write(target, "content")
+        monkeypatch.setattr(Path, "replace", _raiser(OSError("Replace failed")))
+        monkeypatch.setattr(Path, "unlink", _raiser(OSError("Unlink failed")))
+        with pytest.raises(FileOperationError) as exc_info:
+            _atomic_write(target, "content")
 
-                assert "atomic write failed" in str(exc_info.value).lower()
+        assert "atomic write failed" in str(exc_info.value).lower()
 
 
 @pytest.mark.unit
@@ -350,7 +430,7 @@ class TestCreateBackupInternal:
 
         backup = _create_backup_internal(temp_file)
 
-        assert backup.read_text(encoding="utf-8") == original_content
+        _assert_file_eq(backup, original_content)
 
     def test_backup_preserves_metadata(self, temp_file: Path) -> None:
         """Test backup preserves file metadata (timestamps, permissions).
@@ -408,7 +488,7 @@ class TestRestoreBackupInternal:
         # Restore
         _restore_backup_internal(backup, temp_file)
 
-        assert temp_file.read_text(encoding="utf-8") == "test content"
+        _assert_file_eq(temp_file, "test content")
 
     def test_restores_to_new_location(self, temp_file: Path, temp_dir: Path) -> None:
         """Test restore can write to different target path.
@@ -420,8 +500,32 @@ class TestRestoreBackupInternal:
 
         _restore_backup_internal(backup, new_target)
 
-        assert new_target.exists()
-        assert new_target.read_text(encoding="utf-8") == "test content"
+        _assert_file_eq(new_target, "test content")
+
+    @pytest.mark.parametrize(
+        "make_backup",
+        [create_backup, create_timestamped_backup],
+        ids=["backup", "timestamped"],
+    )
+    def test_infers_target_for_backup_suffixed_source(
+        self, temp_dir: Path, make_backup: Callable[[Path], Path]
+    ) -> None:
+        """Test restore_backup infers the target of a ``*.backup`` source.
+
+        Edge case: The source's own .backup suffix must not be mistaken
+        for the end of the backup marker.
+        """
+        source = temp_dir / "pins.backup"
+        source.write_text("test content", encoding="utf-8")
+        backup = make_backup(source)
+        source.unlink()
+
+        restore_backup(backup)
+
+        _assert_file_eq(source, "test content")
+        assert sorted(p.name for p in temp_dir.iterdir()) == sorted(
+            [source.name, backup.name]
+        )
 
     def test_raises_on_missing_backup(self, temp_dir: Path) -> None:
         """Test _restore_backup_internal fails for missing backup.
@@ -441,23 +545,41 @@ class TestRestoreBackupInternal:
 class TestSafeReadFile:
     """Tests for safe_read_file public API."""
 
-    def test_reads_file_content(self, temp_file: Path) -> None:
-        """Test safe_read_file returns file content.
+    @pytest.mark.parametrize(
+        "content,path_type,encoding",
+        [
+            ("test content", Path, "utf-8"),
+            ("test content", str, "utf-8"),
+            (_UNICODE_SAMPLE, Path, "utf-8"),
+            ("", Path, "utf-8"),
+            ("Café ☕", Path, "utf-8"),
+        ],
+        ids=[
+            "reads-file-content",
+            "string-path",
+            "unicode-content",
+            "empty-file",
+            "custom-encoding",
+        ],
+    )
+    def test_reads_content_variants(
+        self,
+        temp_dir: Path,
+        content: str,
+        path_type: Callable[[Path], Any],
+        encoding: str,
+    ) -> None:
+        """Test safe_read_file returns exact content across input variants.
 
-        Happy path: Should return exact file content.
+        Happy path: Path and str inputs, Unicode text, empty files and an
+        explicit encoding should all round-trip the written content.
         """
-        content = safe_read_file(temp_file)
-
-        assert content == "test content"
+        file_path = temp_dir / "read.txt"
+        file_path.write_bytes(content.encode(encoding))
 
-    def test_accepts_string_path(self, temp_file: Path) -> None:
-        """Test safe_read_file accepts string paths.
+        result = safe_read_file(path_type(file_path), encoding=encoding)
 
-        Should work with both Path and str inputs.
-        """
-        content = safe_read_file(str(temp_file))
-
-        assert content == "test content"
+        assert result == content
 
     def test_enforces_size_limit(self, temp_dir: Path) -> None:
         """Test safe_read_file respects max_size parameter.
@@ -486,19 +608,6 @@ class TestSafeReadFile:
 
         assert result == content
 
-    def test_custom_encoding(self, temp_dir: Path) -> None:
-        """Test safe_read_file respects encoding parameter.
-
-        Should use specified encoding for reading.
-        """
-        file_path = temp_dir / "encoded.txt"
-        content = "Café ☕"
-        file_path.write_text(content, encoding="utf-8")
-
-        result = safe_read_file(file_path, encoding="utf-8")
-
-        assert result == content
-
     def test_raises_on_nonexistent_file(self, temp_dir: Path) -> None:
         """Test safe_read_file raises for non-existent files.
 
@@ -521,31 +630,6 @@ class TestSafeReadFile:
 
         assert "not a file" in str(exc_info.value).lower()
 
-    def test_handles_unicode_content(self, temp_dir: Path) -> None:
-        """Test safe_read_file handles Unicode content.
-
-        Edge case: Should handle emoji and international text.
-        """
-        file_path = temp_dir / "unicode.txt"
-        content = "Hello 世界 ��"
-        file_path.write_text(content, encoding="utf-8")
-
-        result = safe_read_file(file_path)
-
-        assert result == content
-
-    def test_handles_empty_file(self, temp_dir: Path) -> None:
-        """Test safe_read_file handles empty files.
-
-        Edge case: Empty files should return empty string.
-        """
-        empty_file = temp_dir / "empty.txt"
-        empty_file.write_text("")
-
-        result = safe_read_file(empty_file)
-
-        assert result == ""
-
     def test_handles_binary_decode_error(self, temp_dir: Path) -> None:
         """Test safe_read_file handles encoding errors.
 
@@ -574,8 +658,7 @@ class TestSafeWriteFile:
 
         safe_write_file(target, content, create_backup=False)
 
-        assert target.exists()
-        assert target.read_text(encoding="utf-8") == content
+        _assert_file_eq(target, content)
 
     def test_creates_backup_by_default(self, temp_file: Path) -> None:
         """Test safe_write_file creates backup by default.
@@ -587,8 +670,7 @@ class TestSafeWriteFile:
         backup = safe_write_file(temp_file, "new content")
 
         assert backup is not None
-        assert backup.exists()
-        assert backup.read_text(encoding="utf-8") == original_content
+        _assert_file_eq(backup, original_content)
 
     def test_skips_backup_when_disabled(self, temp_file: Path) -> None:
         """Test safe_write_file skips backup when create_backup=False.
@@ -610,7 +692,9 @@ class TestSafeWriteFile:
 
         assert backup is None
 
-    def test_restores_backup_on_write_failure(self, temp_file: Path) -> None:
+    def test_restores_backup_on_write_failure(
+        self, temp_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test safe_write_file restores backup if write fails.
 
         Edge case: Original file should be restored on error.
@@ -618,17 +702,19 @@ class TestSafeWriteFile:
         original_content = temp_file.read_text()
 
         # Mock atomic write to fail
-        with patch(
+        monkeypatch.setattr(
             "depkeeper.utils.filesystem._atomic_write",
-            side_effect=FileOperationError(
-                "Mock error", file_path=str(temp_file), operation="write"
+            _raiser(
+                FileOperationError(
+                    "Mock error", file_path=str(temp_file), operation="write"
+                )
             ),
-        ):
-            with pytest.raises(FileOperationError):
-                safe_write_file(temp_file, "new content")
+        )
+        with pytest.raises(FileOperationError):
+            safe_write_file(temp_file, "new content")
 
         # Original content should be restored
-        assert temp_file.read_text(encoding="utf-8") == original_content
+        _assert_file_eq(temp_file, original_content)
 
     def test_accepts_string_path(self, temp_dir: Path) -> None:
         """Test safe_write_file accepts string paths.
@@ -647,11 +733,10 @@ class TestSafeWriteFile:
         Edge case: Should write emoji and international text correctly.
         """
         target = temp_dir / "unicode.txt"
-        content = "Hello 世界 ��"
 
-        safe_write_file(target, content, create_backup=False)
+        safe_write_file(target, _UNICODE_SAMPLE, create_backup=False)
 
-        assert target.read_text(encoding="utf-8") == content
+        assert target.read_bytes() == _UNICODE_SAMPLE_BYTES
 
     def test_overwrites_existing_content(self, temp_file: Path) -> None:
         """Test safe_write_file completely replaces existing content.
@@ -660,28 +745,32 @@ class TestSafeWriteFile:
         """
         safe_write_file(temp_file, "replacement", create_backup=False)
 
-        assert temp_file.read_text(encoding="utf-8") == "replacement"
+        _assert_file_eq(temp_file, "replacement")
 
-    def test_restore_failure_silently_handled(self, temp_file: Path) -> None:
+    def test_restore_failure_silently_handled(
+        self, temp_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test safe_write_file silently handles restore failures.
 
         Edge case: If write fails and restore also fails, should raise original error.
         """
         # Make write fail and restore also fail
-        with patch(
+        monkeypatch.setattr(
             "depkeeper.utils.filesystem._atomic_write",
-            side_effect=FileOperationError(
-                "Write failed", file_path=str(temp_file), operation="write"
+            _raiser(
+                FileOperationError(
+                    "Write failed", file_path=str(temp_file), operation="write"
+                )
             ),
-        ):
-            with patch(
-                "depkeeper.utils.filesystem._restore_backup_internal",
-                side_effect=OSError("Restore failed"),
-            ):
-                with pytest.raises(FileOperationError) as exc_info:
-                    safe_write_file(temp_file, "new content")
+        )
+        monkeypatch.setattr(
+            "depkeeper.utils.filesystem._restore_backup_internal",
+            _raiser(OSError("Restore failed")),
+        )
+        with pytest.raises(FileOperationError) as exc_info:
+            safe_write_file(temp_file, "new content")
 
-                assert "write failed" in str(exc_info.value).lower()
+        assert "write failed" in str(exc_info.value).lower()
 
         # Original file should still exist
         assert temp_file.exists()
@@ -723,7 +812,7 @@ class TestCreateBackup:
 
         backup = create_backup(temp_file)
 
-        assert backup.read_text(encoding="utf-8") == original
+        _assert_file_eq(backup, original)
 
     def test_raises_on_nonexistent_file(self, temp_dir: Path) -> None:
         """Test create_backup fails for non-existent files.
@@ -761,7 +850,7 @@ class TestRestoreBackup:
 
         restore_backup(backup, temp_file)
 
-        assert temp_file.read_text(encoding="utf-8") == "test content"
+        _assert_file_eq(temp_file, "test content")
 
     def test_infers_target_from_backup_name(self, temp_file: Path) -> None:
         """Test restore_backup infers target from backup filename.
@@ -774,8 +863,19 @@ class TestRestoreBackup:
         restore_backup(backup)
 
         # Should restore to original location
-        assert temp_file.exists()
-        assert temp_file.read_text(encoding="utf-8") == "test content"
+        _assert_file_eq(temp_file, "test content")
+
+    def test_infers_target_from_timestamped_backup(self, temp_file: Path) -> None:
+        """Test restore_backup infers target from a timestamped backup name.
+
+        Names from create_timestamped_backup keep the suffix after .backup.
+        """
+        backup = create_timestamped_backup(temp_file)
+        temp_file.unlink()
+
+        restore_backup(backup)
+
+        _assert_file_eq(temp_file, "test content")
 
     def test_raises_on_missing_backup(self, temp_dir: Path) -> None:
         """Test restore_backup fails for non-existent backup.
@@ -812,55 +912,71 @@ class TestRestoreBackup:
 
         restore_backup(str(backup), str(temp_file))
 
-        assert temp_file.read_text(encoding="utf-8") == "test content"
+        _assert_file_eq(temp_file, "test content")
+
+
+@pytest.fixture(scope="class")
+def found_requirements(requirements_structure: Path) -> Dict[str, List[Path]]:
+    """Walk the shared requirements tree once per class, both ways.
+
+    Returns:
+        Dict[str, List[Path]]: Results keyed by ``"recursive"`` and
+        ``"non_recursive"``.
+    """
+    return {
+        "recursive": find_requirements_files(requirements_structure, recursive=True),
+        "non_recursive": find_requirements_files(
+            requirements_structure, recursive=False
+        ),
+    }
 
 
 @pytest.mark.unit
 class TestFindRequirementsFiles:
     """Tests for find_requirements_files discovery."""
 
-    def test_finds_requirements_txt(self, requirements_structure: Path) -> None:
+    def test_finds_requirements_txt(
+        self, found_requirements: Dict[str, List[Path]]
+    ) -> None:
         """Test finds standard requirements.txt file.
 
         Happy path: Should find requirements.txt in root.
         """
-        files = find_requirements_files(requirements_structure)
-
-        names = [f.name for f in files]
+        names = [f.name for f in found_requirements["recursive"]]
         assert "requirements.txt" in names
 
-    def test_finds_requirements_dev_txt(self, requirements_structure: Path) -> None:
+    def test_finds_requirements_dev_txt(
+        self, found_requirements: Dict[str, List[Path]]
+    ) -> None:
         """Test finds requirements-dev.txt variant.
 
         Should find files matching requirements-*.txt pattern.
         """
-        files = find_requirements_files(requirements_structure)
-
-        names = [f.name for f in files]
+        names = [f.name for f in found_requirements["recursive"]]
         assert "requirements-dev.txt" in names
         assert "requirements-test.txt" in names
 
-    def test_finds_nested_requirements(self, requirements_structure: Path) -> None:
+    def test_finds_nested_requirements(
+        self, found_requirements: Dict[str, List[Path]]
+    ) -> None:
         """Test finds requirements files in subdirectories.
 
         Should recursively search subdirectories by default.
         """
-        files = find_requirements_files(requirements_structure, recursive=True)
-
         # Should find files in requirements/ subdirectory
-        paths = [f.as_posix() for f in files]
+        paths = [f.as_posix() for f in found_requirements["recursive"]]
         assert any("requirements/base.txt" in p for p in paths)
         assert any("requirements/test.txt" in p for p in paths)
 
-    def test_non_recursive_search(self, requirements_structure: Path) -> None:
+    def test_non_recursive_search(
+        self, found_requirements: Dict[str, List[Path]]
+    ) -> None:
         """Test non-recursive search only finds root level files.
 
         With recursive=False, should only find files in root directory.
         """
-        files = find_requirements_files(requirements_structure, recursive=False)
-
         # Should find root level files
-        names = [f.name for f in files]
+        names = [f.name for f in found_requirements["non_recursive"]]
         assert "requirements.txt" in names
 
         # Should NOT find nested files
@@ -868,15 +984,13 @@ class TestFindRequirementsFiles:
         assert "test.txt" not in names
 
     def test_excludes_non_requirements_files(
-        self, requirements_structure: Path
+        self, found_requirements: Dict[str, List[Path]]
     ) -> None:
         """Test ignores files that don't match requirements patterns.
 
         Should not find README.md, setup.py, etc.
         """
-        files = find_requirements_files(requirements_structure)
-
-        names = [f.name for f in files]
+        names = [f.name for f in found_requirements["recursive"]]
         assert "README.md" not in names
         assert "setup.py" not in names
 
@@ -909,12 +1023,31 @@ class TestFindRequirementsFiles:
 
         assert files == []
 
-    def test_returns_sorted_unique_results(self, requirements_structure: Path) -> None:
+    @pytest.mark.parametrize("recursive", [True, False], ids=["recursive", "flat"])
+    def test_excludes_directories_matching_pattern(
+        self, temp_dir: Path, recursive: bool
+    ) -> None:
+        """Test directories named like requirement files are not returned.
+
+        Edge case: Only regular files are reported. A recursive search
+        still descends into such a directory.
+        """
+        (temp_dir / "requirements.txt").mkdir()
+        (temp_dir / "requirements.txt" / "requirements.txt").write_text("six\n")
+
+        files = find_requirements_files(temp_dir, recursive=recursive)
+
+        nested = temp_dir.resolve() / "requirements.txt" / "requirements.txt"
+        assert files == ([nested] if recursive else [])
+
+    def test_returns_sorted_unique_results(
+        self, found_requirements: Dict[str, List[Path]]
+    ) -> None:
         """Test results are sorted and contain no duplicates.
 
         Should return consistent, sorted list of unique paths.
         """
-        files = find_requirements_files(requirements_structure)
+        files = found_requirements["recursive"]
 
         # Should be sorted
         assert files == sorted(files)
@@ -955,22 +1088,20 @@ class TestValidatePath:
         assert "~" not in str(result)
         assert result.is_absolute()
 
-    def test_resolves_relative_path(self, temp_dir: Path) -> None:
+    def test_resolves_relative_path(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_path resolves relative paths.
 
         Should convert relative to absolute paths.
         """
         # Change to temp directory
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_dir)
+        monkeypatch.chdir(temp_dir)
 
-            result = validate_path("test.txt")
+        result = validate_path("test.txt")
 
-            assert result.is_absolute()
-            assert temp_dir in result.parents or result.parent == temp_dir
-        finally:
-            os.chdir(original_cwd)
+        assert result.is_absolute()
+        assert temp_dir in result.parents or result.parent == temp_dir
 
     def test_allows_path_within_base_dir(self, temp_dir: Path) -> None:
         """Test validate_path accepts paths within base_dir.
@@ -1015,31 +1146,25 @@ class TestValidatePath:
 
         assert result.is_absolute()
 
-    def test_relative_base_dir(self, temp_dir: Path) -> None:
+    def test_relative_base_dir(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_path handles relative base_dir.
 
         Should resolve relative base_dir to absolute path.
         """
-        original_cwd = Path.cwd()
-        try:
-            # Change to temp directory
-            import os
-
-            os.chdir(temp_dir)
-
-            # Create a file in temp dir
-            test_file = temp_dir / "test.txt"
-            test_file.write_text("test")
+        # Change to temp directory
+        monkeypatch.chdir(temp_dir)
 
-            # Use relative base_dir
-            result = validate_path(test_file, base_dir=".")
+        # Create a file in temp dir
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("test")
 
-            assert result.is_absolute()
-            assert result == test_file.resolve()
-        finally:
-            import os
+        # Use relative base_dir
+        result = validate_path(test_file, base_dir=".")
 
-            os.chdir(original_cwd)
+        assert result.is_absolute()
+        assert result == test_file.resolve()
 
     def test_handles_nonexistent_paths(self, temp_dir: Path) -> None:
         """Test validate_path works with non-existent paths.
@@ -1065,6 +1190,27 @@ class TestValidatePath:
 
         assert result.is_absolute()
 
+    @pytest.mark.skipif(not SYMLINKS_SUPPORTED, reason="Symlinks not supported")
+    def test_rejects_symlink_before_resolve(
+        self, temp_file: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test reject_symlinks fails on the unresolved path.
+
+        Security: The link must be detected via lstat before resolution,
+        so the rejection never reaches realpath.
+        """
+        symlink = temp_dir / "link.txt"
+        symlink.symlink_to(temp_file)
+        monkeypatch.setattr(
+            os.path, "realpath", _raiser(AssertionError("resolved before check"))
+        )
+
+        with pytest.raises(FileOperationError) as exc_info:
+            validate_path(symlink, reject_symlinks=True)
+
+        assert exc_info.value.operation == "validate"
+        assert "symlink" in str(exc_info.value).lower()
+
 
 @pytest.mark.unit
 class TestCreateTimestampedBackup:
@@ -1106,7 +1252,7 @@ class TestCreateTimestampedBackup:
 
         backup = create_timestamped_backup(temp_file)
 
-        assert backup.read_text(encoding="utf-8") == original
+        _assert_file_eq(backup, original)
 
     def test_multiple_backups_unique(self, temp_file: Path) -> None:
         """Test multiple backups have unique names.
@@ -1195,7 +1341,7 @@ class TestEdgeCases:
         Integration test: Full write/read cycle.
         """
         file_path = temp_dir / "cycle.txt"
-        content = "Test content with �� unicode"
+        content = "Test content with 🚀 unicode"
 
         safe_write_file(file_path, content, create_backup=False)
         result = safe_read_file(file_path)
@@ -1212,7 +1358,6 @@ class TestEdgeCases:
 
         safe_write_file(nested, "content", create_backup=False)
 
-        assert nested.exists()
         assert safe_read_file(nested) == "content"
 
     def test_special_characters_in_content(self, temp_dir: Path) -> None:
@@ -1221,7 +1366,7 @@ class TestEdgeCases:
         Cross-platform: Unicode should work on all platforms.
         """
         file_path = temp_dir / "unicode.txt"
-        content = "Hello 世界 �� Привет مرحبا"
+        content = "Hello 世界 🚀 Привет مرحبا"
 
         safe_write_file(file_path, content, create_backup=False)
         result = safe_read_file(file_path)
@@ -1254,7 +1399,7 @@ class TestEdgeCases:
         temp_file.write_text("modified")
         restore_backup(backup, temp_file)
 
-        assert temp_file.read_text(encoding="utf-8") == original
+        _assert_file_eq(temp_file, original)
 
     def test_special_characters_in_filename(self, temp_dir: Path) -> None:
         """Test handles special characters in filenames.
@@ -1283,8 +1428,7 @@ class TestEdgeCases:
 
         # Backup empty file
         backup = create_backup(empty_file)
-        assert backup.exists()
-        assert backup.read_text(encoding="utf-8") == ""
+        _assert_file_eq(backup, "")
 
     def test_whitespace_only_content(self, temp_dir: Path) -> None:
         """Test files with only whitespace.
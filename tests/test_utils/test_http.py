@@ -4,7 +4,7 @@ import json
 import httpx
 import pytest
 import asyncio
-from typing import Any, Dict, Generator, List
+from typing import Any, AsyncIterator, Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from depkeeper.utils.http import HTTPClient
@@ -12,20 +12,33 @@ from depkeeper.exceptions import NetworkError, PyPIError
 
 
 @pytest.fixture
-def http_client() -> Generator[HTTPClient, None, None]:
+async def http_client() -> AsyncIterator[HTTPClient]:
     """Create an HTTPClient instance for testing.
 
     Yields:
         HTTPClient: A configured client instance with short timeouts for testing.
 
     Note:
-        Ensures proper cleanup by closing the client after test completion.
+        Async fixture (asyncio_mode = "auto"), so the client is closed on
+        the test's own event loop after test completion.
     """
     client = HTTPClient(timeout=5, max_retries=2)
-    yield client
-    # Ensure client is closed to prevent resource leaks
-    if client._client is not None:
-        asyncio.get_event_loop().run_until_complete(client.close())
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def _install_mock_client(client: HTTPClient) -> AsyncMock:
+    """Give ``client`` a mocked ``httpx.AsyncClient`` and return its request mock.
+
+    Skips building a real client (SSL context, HTTP/2 setup, connection
+    pool) in tests that only exercise the retry logic.
+    """
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    client._client = mock_client
+    request: AsyncMock = mock_client.request
+    return request
 
 
 @pytest.mark.unit
@@ -114,7 +127,6 @@ class TestHTTPClientInit:
 class TestHTTPClientContextManager:
     """Tests for HTTPClient async context manager protocol."""
 
-    @pytest.mark.asyncio
     async def test_context_manager_creates_client(self) -> None:
         """Test async context manager initializes httpx client on entry.
 
@@ -125,7 +137,6 @@ class TestHTTPClientContextManager:
             assert client._client is not None
             assert isinstance(client._client, httpx.AsyncClient)
 
-    @pytest.mark.asyncio
     async def test_context_manager_closes_client(self) -> None:
         """Test async context manager properly closes client on exit.
 
@@ -138,7 +149,6 @@ class TestHTTPClientContextManager:
 
         assert client._client is None
 
-    @pytest.mark.asyncio
     async def test_context_manager_closes_on_exception(self) -> None:
         """Test client is closed even when exception occurs in context.
 
@@ -156,7 +166,6 @@ class TestHTTPClientContextManager:
         # Client should still be closed
         assert client._client is None
 
-    @pytest.mark.asyncio
     async def test_multiple_context_manager_entries(self) -> None:
         """Test client can be used with context manager multiple times.
 
@@ -183,7 +192,6 @@ class TestHTTPClientContextManager:
 class TestHTTPClientEnsureClient:
     """Tests for HTTPClient._ensure_client internal method."""
 
-    @pytest.mark.asyncio
     async def test_ensure_client_creates_once(self) -> None:
         """Test _ensure_client is idempotent (creates only once).
 
@@ -201,7 +209,6 @@ class TestHTTPClientEnsureClient:
         assert first_client is second_client
         await client.close()
 
-    @pytest.mark.asyncio
     async def test_ensure_client_configures_correctly(self) -> None:
         """Test _ensure_client passes configuration to httpx.AsyncClient.
 
@@ -216,7 +223,6 @@ class TestHTTPClientEnsureClient:
         assert client._client.headers["User-Agent"] == "TestAgent"
         await client.close()
 
-    @pytest.mark.asyncio
     async def test_ensure_client_enables_http2(self) -> None:
         """Test _ensure_client enables HTTP/2 support.
 
@@ -234,7 +240,6 @@ class TestHTTPClientEnsureClient:
 class TestHTTPClientClose:
     """Tests for HTTPClient.close cleanup method."""
 
-    @pytest.mark.asyncio
     async def test_close_sets_client_to_none(self) -> None:
         """Test close nullifies the _client reference.
 
@@ -247,7 +252,6 @@ class TestHTTPClientClose:
         await client.close()
         assert client._client is None
 
-    @pytest.mark.asyncio
     async def test_close_when_no_client(self) -> None:
         """Test close is safe to call when no client exists.
 
@@ -260,7 +264,6 @@ class TestHTTPClientClose:
         await client.close()
         assert client._client is None
 
-    @pytest.mark.asyncio
     async def test_close_multiple_times(self) -> None:
         """Test close can be called multiple times safely.
 
@@ -281,7 +284,6 @@ class TestHTTPClientClose:
 class TestHTTPClientRateLimit:
     """Tests for HTTPClient._rate_limit rate limiting mechanism."""
 
-    @pytest.mark.asyncio
     async def test_rate_limit_no_delay(self) -> None:
         """Test rate limit with zero delay is effectively disabled.
 
@@ -298,7 +300,6 @@ class TestHTTPClientRateLimit:
         # Should be nearly instant
         assert elapsed < 0.05
 
-    @pytest.mark.asyncio
     async def test_rate_limit_enforces_delay(self) -> None:
         """Test rate limit enforces minimum delay between requests.
 
@@ -319,7 +320,6 @@ class TestHTTPClientRateLimit:
         # Should have waited approximately 0.1 seconds
         assert elapsed >= 0.08  # Allow some tolerance for timing jitter
 
-    @pytest.mark.asyncio
     async def test_rate_limit_concurrent_calls(self) -> None:
         """Test rate limit serializes concurrent calls properly.
 
@@ -344,7 +344,6 @@ class TestHTTPClientRateLimit:
         # Should take at least 2 * delay (3 calls - 1st is immediate)
         assert elapsed >= 0.08
 
-    @pytest.mark.asyncio
     async def test_rate_limit_updates_last_request_time(self) -> None:
         """Test rate limit correctly tracks last request time.
 
@@ -358,7 +357,6 @@ class TestHTTPClientRateLimit:
 
         assert after_first > initial_time
 
-    @pytest.mark.asyncio
     async def test_rate_limit_with_negative_delay(self) -> None:
         """Test rate limit handles negative delay gracefully.
 
@@ -381,7 +379,6 @@ class TestHTTPClientRateLimit:
 class TestHTTPClientRequestWithRetry:
     """Tests for HTTPClient._request_with_retry core retry logic."""
 
-    @pytest.mark.asyncio
     async def test_successful_request(self) -> None:
         """Test successful request returns response without retries.
 
@@ -392,20 +389,14 @@ class TestHTTPClientRequestWithRetry:
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = mock_response
 
-            async with client:
-                response = await client._request_with_retry(
-                    "GET", "https://example.com"
-                )
+        response = await client._request_with_retry("GET", "https://example.com")
 
-            assert response.status_code == 200
-            assert mock_request.call_count == 1
+        assert response.status_code == 200
+        assert mock_request.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_strips_quotes_from_url(self) -> None:
         """Test URL cleaning removes surrounding quotes.
 
@@ -417,22 +408,17 @@ class TestHTTPClientRequestWithRetry:
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = mock_response
 
-            async with client:
-                await client._request_with_retry("GET", '"https://example.com"')
-                await client._request_with_retry("GET", "'https://example.com'")
+        await client._request_with_retry("GET", '"https://example.com"')
+        await client._request_with_retry("GET", "'https://example.com'")
 
-            # Both should be called with clean URL
-            assert all(
-                args[0][1] == "https://example.com"
-                for args in mock_request.call_args_list
-            )
+        # Both should be called with clean URL
+        assert all(
+            args[0][1] == "https://example.com" for args in mock_request.call_args_list
+        )
 
-    @pytest.mark.asyncio
     async def test_strips_whitespace_from_url(self) -> None:
         """Test URL cleaning removes whitespace.
 
@@ -443,18 +429,14 @@ class TestHTTPClientRequestWithRetry:
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = mock_response
 
-            async with client:
-                await client._request_with_retry("GET", "  https://example.com  ")
+        await client._request_with_retry("GET", "  https://example.com  ")
 
-            call_url = mock_request.call_args[0][1]
-            assert call_url == "https://example.com"
+        call_url = mock_request.call_args[0][1]
+        assert call_url == "https://example.com"
 
-    @pytest.mark.asyncio
     async def test_404_raises_pypi_error(self) -> None:
         """Test 404 response raises PyPIError immediately without retry.
 
@@ -465,21 +447,17 @@ class TestHTTPClientRequestWithRetry:
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 404
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = mock_response
 
-            async with client:
-                with pytest.raises(PyPIError) as exc_info:
-                    await client._request_with_retry("GET", "https://pypi.org/test")
+        with pytest.raises(PyPIError) as exc_info:
+            await client._request_with_retry("GET", "https://pypi.org/test")
 
-            assert "not found" in str(exc_info.value).lower()
-            assert exc_info.value.status_code == 404
-            # Should not retry 404s
-            assert mock_request.call_count == 1
+        assert "not found" in str(exc_info.value).lower()
+        assert exc_info.value.status_code == 404
+        # Should not retry 404s
+        assert mock_request.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_429_retries_with_backoff(self) -> None:
         """Test 429 (rate limit) response triggers retry with Retry-After.
 
@@ -495,20 +473,14 @@ class TestHTTPClientRequestWithRetry:
         success_response = MagicMock(spec=httpx.Response)
         success_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = [rate_limited_response, success_response]
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = [rate_limited_response, success_response]
 
-            async with client:
-                response = await client._request_with_retry(
-                    "GET", "https://example.com"
-                )
+        response = await client._request_with_retry("GET", "https://example.com")
 
-            assert response.status_code == 200
-            assert mock_request.call_count == 2
+        assert response.status_code == 200
+        assert mock_request.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_429_default_retry_after(self) -> None:
         """Test 429 response uses default 1s delay when Retry-After missing.
 
@@ -526,20 +498,16 @@ class TestHTTPClientRequestWithRetry:
 
         import time
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = [rate_limited_response, success_response]
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = [rate_limited_response, success_response]
 
-            async with client:
-                start = time.time()
-                await client._request_with_retry("GET", "https://example.com")
-                elapsed = time.time() - start
+        start = time.time()
+        await client._request_with_retry("GET", "https://example.com")
+        elapsed = time.time() - start
 
-            # Should wait at least 1 second (default)
-            assert elapsed >= 0.9
+        # Should wait at least 1 second (default)
+        assert elapsed >= 0.9
 
-    @pytest.mark.asyncio
     async def test_429_max_retries_exceeded(self) -> None:
         """Test 429 raises NetworkError after max 429 retries.
 
@@ -553,19 +521,15 @@ class TestHTTPClientRequestWithRetry:
         rate_limited_response.status_code = 429
         rate_limited_response.headers = {"Retry-After": "0"}
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = rate_limited_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = rate_limited_response
 
-            async with client:
-                with pytest.raises(NetworkError) as exc_info:
-                    await client._request_with_retry("GET", "https://example.com")
+        with pytest.raises(NetworkError) as exc_info:
+            await client._request_with_retry("GET", "https://example.com")
 
-            assert "Rate limit exceeded" in str(exc_info.value)
-            assert exc_info.value.status_code == 429
+        assert "Rate limit exceeded" in str(exc_info.value)
+        assert exc_info.value.status_code == 429
 
-    @pytest.mark.asyncio
     async def test_timeout_retries(self) -> None:
         """Test timeout exception triggers retry with exponential backoff.
 
@@ -576,23 +540,17 @@ class TestHTTPClientRequestWithRetry:
         success_response = MagicMock(spec=httpx.Response)
         success_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = [
-                httpx.TimeoutException("Timeout"),
-                success_response,
-            ]
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = [
+            httpx.TimeoutException("Timeout"),
+            success_response,
+        ]
 
-            async with client:
-                response = await client._request_with_retry(
-                    "GET", "https://example.com"
-                )
+        response = await client._request_with_retry("GET", "https://example.com")
 
-            assert response.status_code == 200
-            assert mock_request.call_count == 2
+        assert response.status_code == 200
+        assert mock_request.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_network_error_retries(self) -> None:
         """Test network error triggers retry.
 
@@ -603,23 +561,17 @@ class TestHTTPClientRequestWithRetry:
         success_response = MagicMock(spec=httpx.Response)
         success_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = [
-                httpx.NetworkError("Connection failed"),
-                success_response,
-            ]
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = [
+            httpx.NetworkError("Connection failed"),
+            success_response,
+        ]
 
-            async with client:
-                response = await client._request_with_retry(
-                    "GET", "https://example.com"
-                )
+        response = await client._request_with_retry("GET", "https://example.com")
 
-            assert response.status_code == 200
-            assert mock_request.call_count == 2
+        assert response.status_code == 200
+        assert mock_request.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_4xx_error_raises_network_error(self) -> None:
         """Test 4xx client errors (except 404, 429) raise NetworkError.
 
@@ -636,21 +588,17 @@ class TestHTTPClientRequestWithRetry:
             response=mock_response,
         )
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = mock_response
 
-            async with client:
-                with pytest.raises(NetworkError) as exc_info:
-                    await client._request_with_retry("GET", "https://example.com")
+        with pytest.raises(NetworkError) as exc_info:
+            await client._request_with_retry("GET", "https://example.com")
 
-            assert "403" in str(exc_info.value)
-            assert exc_info.value.status_code == 403
-            # Should not retry 4xx
-            assert mock_request.call_count == 1
+        assert "403" in str(exc_info.value)
+        assert exc_info.value.status_code == 403
+        # Should not retry 4xx
+        assert mock_request.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_multiple_4xx_codes(self) -> None:
         """Test various 4xx status codes all raise NetworkError.
 
@@ -668,18 +616,14 @@ class TestHTTPClientRequestWithRetry:
                 response=mock_response,
             )
 
-            with patch.object(
-                httpx.AsyncClient, "request", new_callable=AsyncMock
-            ) as mock_request:
-                mock_request.return_value = mock_response
+            mock_request = _install_mock_client(client)
+            mock_request.return_value = mock_response
 
-                async with client:
-                    with pytest.raises(NetworkError) as exc_info:
-                        await client._request_with_retry("GET", "https://example.com")
+            with pytest.raises(NetworkError) as exc_info:
+                await client._request_with_retry("GET", "https://example.com")
 
-                assert str(status_code) in str(exc_info.value)
+            assert str(status_code) in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_5xx_error_retries(self) -> None:
         """Test 5xx server errors trigger retry.
 
@@ -698,20 +642,14 @@ class TestHTTPClientRequestWithRetry:
         success_response = MagicMock(spec=httpx.Response)
         success_response.status_code = 200
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = [error_response, success_response]
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = [error_response, success_response]
 
-            async with client:
-                response = await client._request_with_retry(
-                    "GET", "https://example.com"
-                )
+        response = await client._request_with_retry("GET", "https://example.com")
 
-            assert response.status_code == 200
-            assert mock_request.call_count == 2
+        assert response.status_code == 200
+        assert mock_request.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_multiple_5xx_codes(self) -> None:
         """Test various 5xx status codes all trigger retry.
 
@@ -731,19 +669,13 @@ class TestHTTPClientRequestWithRetry:
             success_response = MagicMock(spec=httpx.Response)
             success_response.status_code = 200
 
-            with patch.object(
-                httpx.AsyncClient, "request", new_callable=AsyncMock
-            ) as mock_request:
-                mock_request.side_effect = [error_response, success_response]
+            mock_request = _install_mock_client(client)
+            mock_request.side_effect = [error_response, success_response]
 
-                async with client:
-                    response = await client._request_with_retry(
-                        "GET", "https://example.com"
-                    )
+            response = await client._request_with_retry("GET", "https://example.com")
 
-                assert response.status_code == 200
+            assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_max_retries_exceeded_raises_error(self) -> None:
         """Test NetworkError is raised after exhausting all retries.
 
@@ -751,20 +683,16 @@ class TestHTTPClientRequestWithRetry:
         """
         client = HTTPClient(max_retries=2)
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = httpx.TimeoutException("Timeout")
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = httpx.TimeoutException("Timeout")
 
-            async with client:
-                with pytest.raises(NetworkError) as exc_info:
-                    await client._request_with_retry("GET", "https://example.com")
+        with pytest.raises(NetworkError) as exc_info:
+            await client._request_with_retry("GET", "https://example.com")
 
-            assert "failed after" in str(exc_info.value).lower()
-            # Should try max_retries + 1 times (initial + retries)
-            assert mock_request.call_count == 3
+        assert "failed after" in str(exc_info.value).lower()
+        # Should try max_retries + 1 times (initial + retries)
+        assert mock_request.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_exponential_backoff_timing(self) -> None:
         """Test retry delays follow exponential backoff pattern.
 
@@ -774,24 +702,20 @@ class TestHTTPClientRequestWithRetry:
 
         import time
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = httpx.TimeoutException("Timeout")
+        mock_request = _install_mock_client(client)
+        mock_request.side_effect = httpx.TimeoutException("Timeout")
 
-            async with client:
-                start = time.time()
-                try:
-                    await client._request_with_retry("GET", "https://example.com")
-                except NetworkError:
-                    pass
-                elapsed = time.time() - start
+        start = time.time()
+        try:
+            await client._request_with_retry("GET", "https://example.com")
+        except NetworkError:
+            pass
+        elapsed = time.time() - start
 
-            # Total wait should be at least: 2^0 + 2^1 + 2^2 = 7 seconds
-            # (minus jitter which is at most 0.3 per retry)
-            assert elapsed >= 6.0
+        # Total wait should be at least: 2^0 + 2^1 + 2^2 = 7 seconds
+        # (minus jitter which is at most 0.3 per retry)
+        assert elapsed >= 6.0
 
-    @pytest.mark.asyncio
     async def test_success_status_codes(self) -> None:
         """Test various 2xx success codes are handled correctly.
 
@@ -803,19 +727,13 @@ class TestHTTPClientRequestWithRetry:
             mock_response = MagicMock(spec=httpx.Response)
             mock_response.status_code = status_code
 
-            with patch.object(
-                httpx.AsyncClient, "request", new_callable=AsyncMock
-            ) as mock_request:
-                mock_request.return_value = mock_response
+            mock_request = _install_mock_client(client)
+            mock_request.return_value = mock_response
 
-                async with client:
-                    response = await client._request_with_retry(
-                        "GET", "https://example.com"
-                    )
+            response = await client._request_with_retry("GET", "https://example.com")
 
-                assert response.status_code == status_code
+            assert response.status_code == status_code
 
-    @pytest.mark.asyncio
     async def test_redirect_status_codes(self) -> None:
         """Test 3xx redirect codes are handled by httpx.
 
@@ -827,24 +745,18 @@ class TestHTTPClientRequestWithRetry:
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200  # After redirect
 
-        with patch.object(
-            httpx.AsyncClient, "request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = _install_mock_client(client)
+        mock_request.return_value = mock_response
 
-            async with client:
-                response = await client._request_with_retry(
-                    "GET", "https://example.com"
-                )
+        response = await client._request_with_retry("GET", "https://example.com")
 
-            assert response.status_code == 200
+        assert response.status_code == 200
 
 
 @pytest.mark.unit
 class TestHTTPClientGet:
     """Tests for HTTPClient.get convenience method."""
 
-    @pytest.mark.asyncio
     async def test_get_request(self) -> None:
         """Test GET request delegates to _request_with_retry.
 
@@ -866,7 +778,6 @@ class TestHTTPClientGet:
             assert response.status_code == 200
             mock_request.assert_called_once_with("GET", "https://example.com")
 
-    @pytest.mark.asyncio
     async def test_get_with_params(self) -> None:
         """Test GET request passes through kwargs.
 
@@ -898,7 +809,6 @@ class TestHTTPClientGet:
 class TestHTTPClientPost:
     """Tests for HTTPClient.post convenience method."""
 
-    @pytest.mark.asyncio
     async def test_post_request(self) -> None:
         """Test POST request delegates to _request_with_retry.
 
@@ -923,7 +833,6 @@ class TestHTTPClientPost:
             assert response.status_code == 201
             mock_request.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_post_with_data(self) -> None:
         """Test POST request with different data types.
 
@@ -956,7 +865,6 @@ class TestHTTPClientPost:
 class TestHTTPClientGetJson:
     """Tests for HTTPClient.get_json JSON parsing method."""
 
-    @pytest.mark.asyncio
     async def test_get_json_success(self) -> None:
         """Test successful JSON fetch and parse.
 
@@ -975,7 +883,6 @@ class TestHTTPClientGetJson:
 
             assert data == {"name": "package", "version": "1.0.0"}
 
-    @pytest.mark.asyncio
     async def test_get_json_invalid_json(self) -> None:
         """Test error when response contains invalid JSON.
 
@@ -997,7 +904,6 @@ class TestHTTPClientGetJson:
             assert "Invalid JSON" in str(exc_info.value)
             assert exc_info.value.response_body == "Invalid JSON"
 
-    @pytest.mark.asyncio
     async def test_get_json_non_object_response(self) -> None:
         """Test error when JSON is not an object/dict.
 
@@ -1019,7 +925,6 @@ class TestHTTPClientGetJson:
 
                 assert "Expected JSON object" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_get_json_empty_object(self) -> None:
         """Test successful parse of empty JSON object.
 
@@ -1038,7 +943,6 @@ class TestHTTPClientGetJson:
 
             assert data == {}
 
-    @pytest.mark.asyncio
     async def test_get_json_nested_structure(self) -> None:
         """Test parsing complex nested JSON structures.
 
@@ -1068,7 +972,6 @@ class TestHTTPClientGetJson:
 class TestHTTPClientBatchGetJson:
     """Tests for HTTPClient.batch_get_json concurrent fetch method."""
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_success(self) -> None:
         """Test successful concurrent fetch of multiple JSON endpoints.
 
@@ -1094,7 +997,6 @@ class TestHTTPClientBatchGetJson:
             assert results["https://example.com/2"]["url"] == "https://example.com/2"
             assert results["https://example.com/3"]["url"] == "https://example.com/3"
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_with_failures(self) -> None:
         """Test batch fetch handles individual failures gracefully.
 
@@ -1130,7 +1032,6 @@ class TestHTTPClientBatchGetJson:
             assert results["https://example.com/2"]["url"] == "https://example.com/2"
             assert results["https://example.com/3"] == {}
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_with_progress_callback(self) -> None:
         """Test batch fetch invokes progress callback correctly.
 
@@ -1167,7 +1068,6 @@ class TestHTTPClientBatchGetJson:
             # Final call should be (3, 3)
             assert progress_calls[-1] == (3, 3)
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_progress_callback_with_failures(self) -> None:
         """Test progress callback is called even when requests fail.
 
@@ -1193,7 +1093,6 @@ class TestHTTPClientBatchGetJson:
             assert len(progress_calls) == 2
             assert progress_calls == [(1, 2), (2, 2)]
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_empty_urls(self) -> None:
         """Test batch fetch with empty URL list.
 
@@ -1206,7 +1105,6 @@ class TestHTTPClientBatchGetJson:
 
         assert results == {}
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_single_url(self) -> None:
         """Test batch fetch with single URL.
 
@@ -1226,7 +1124,6 @@ class TestHTTPClientBatchGetJson:
             assert len(results) == 1
             assert results["https://example.com/1"]["url"] == "https://example.com/1"
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_preserves_url_order(self) -> None:
         """Test batch fetch returns results keyed by original URLs.
 
@@ -1246,7 +1143,6 @@ class TestHTTPClientBatchGetJson:
             # All original URLs should be keys
             assert set(results.keys()) == set(urls)
 
-    @pytest.mark.asyncio
     async def test_batch_get_json_large_batch(self) -> None:
         """Test batch fetch handles large number of URLs.
 
@@ -1272,7 +1168,6 @@ class TestHTTPClientBatchGetJson:
 class TestHTTPClientConcurrency:
     """Tests for HTTPClient concurrency control and semaphore."""
 
-    @pytest.mark.asyncio
     async def test_semaphore_limits_concurrency(self) -> None:
         """Test semaphore limits number of concurrent requests.
 
@@ -1305,7 +1200,6 @@ class TestHTTPClientConcurrency:
         # Max concurrent should not exceed semaphore limit
         assert max_concurrent[0] <= 2
 
-    @pytest.mark.asyncio
     async def test_different_concurrency_limits(self) -> None:
         """Test different max_concurrency values work correctly.
 
@@ -1337,7 +1231,6 @@ class TestHTTPClientConcurrency:
 
             assert max_concurrent[0] <= max_conc
 
-    @pytest.mark.asyncio
     async def test_semaphore_releases_on_error(self) -> None:
         """Test semaphore is released even when request fails.
 
@@ -1374,7 +1267,6 @@ class TestHTTPClientConcurrency:
 class TestHTTPClientIntegration:
     """Integration tests combining multiple features."""
 
-    @pytest.mark.asyncio
     async def test_rate_limit_and_retry_together(self) -> None:
         """Test rate limiting works correctly with retry logic.
 
@@ -1404,7 +1296,6 @@ class TestHTTPClientIntegration:
             # Should have waited for rate limit + backoff
             assert elapsed >= 0.04
 
-    @pytest.mark.asyncio
     async def test_concurrent_requests_with_rate_limit(self) -> None:
         """Test concurrent requests all respect rate limit.
 
@@ -1437,7 +1328,6 @@ class TestHTTPClientIntegration:
             # Should take at least 2 * rate_limit_delay (3 requests - first is immediate)
             assert elapsed >= 0.08
 
-    @pytest.mark.asyncio
     async def test_batch_with_mixed_success_and_failure(self) -> None:
         """Test batch fetch with mix of successes and failures.
 
@@ -1477,7 +1367,6 @@ class TestHTTPClientIntegration:
         # Failure case - should return empty dict
         assert results["https://example.com/fail"] == {}
 
-    @pytest.mark.asyncio
     async def test_retry_logic_with_actual_request(self) -> None:
         """Test retry logic integration with real request flow.
 
@@ -1510,7 +1399,6 @@ class TestHTTPClientIntegration:
         # Should have been called twice (initial + 1 retry)
         assert call_count[0] == 2
 
-    @pytest.mark.asyncio
     async def test_client_reuse_across_multiple_operations(self) -> None:
         """Test client can be reused for multiple operations.
 